@@ -0,0 +1,328 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, Optional, Set
+from api.core.logger import APILogger
+from api.core.metrics import Histogram
+
+logger = APILogger()
+
+# 버퍼가 가득 찼을 때의 정책
+POLICY_PAUSE = "pause"  # 공간이 생길 때까지 업스트림 읽기 중단
+POLICY_COALESCE = "coalesce"  # 연속된 text-delta(data-field-delta)를 하나로 합쳐 이벤트 수를 늘리지 않음 (바이트 한도 초과 시 pause)
+POLICY_DROP = "drop"  # drop_after 초 동안 공간이 생기지 않으면 스트림 종료
+BUFFER_POLICIES = (POLICY_PAUSE, POLICY_COALESCE, POLICY_DROP)
+
+# 이벤트 크기 추정 시 dict/JSON 오버헤드
+EVENT_OVERHEAD_BYTES = 64
+
+_END = object()
+
+
+class SlowConsumerError(Exception):
+    """클라이언트가 제한 시간 내에 버퍼를 비우지 못한 경우"""
+
+
+def estimate_event_size(event: Dict[str, Any]) -> int:
+    """버퍼 점유량 계산용 이벤트 크기 추정 (바이트)"""
+    delta = event.get("delta")
+    if isinstance(delta, str):
+        return len(delta.encode()) + EVENT_OVERHEAD_BYTES
+    data = event.get("data")
+    if isinstance(data, dict):
+        # 구조화 응답 이벤트 (data-*): 완성된 필드 값은 크기가 클 수 있어 직렬화 길이로 계산
+        delta = data.get("delta")
+        if isinstance(delta, str):
+            return len(delta.encode()) + EVENT_OVERHEAD_BYTES
+        return len(json.dumps(data, ensure_ascii=False, default=str).encode()) + EVENT_OVERHEAD_BYTES
+    return EVENT_OVERHEAD_BYTES * 2
+
+
+class StreamMemoryBudget:
+    """
+    스트림 버퍼 전체 메모리 예산 (워커 프로세스 단위)
+
+    모든 스트림 버퍼가 예약한 바이트 합이 budget_bytes를 넘지 않도록 하고,
+    스트림별 점유량을 조회할 수 있도록 활성 버퍼를 추적합니다.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.peak_bytes_per_stream = Histogram(
+            buckets=(1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+        )
+        self._buffers: Dict[str, "BoundedStreamBuffer"] = {}
+        self._waiters: Set[asyncio.Event] = set()
+
+    def try_reserve(self, size: int) -> bool:
+        if self.used_bytes + size > self.budget_bytes:
+            return False
+        self.used_bytes += size
+        return True
+
+    def force_reserve(self, size: int) -> None:
+        """예산과 무관하게 예약 (빈 버퍼가 최소 1개 이벤트는 진행할 수 있도록)"""
+        self.used_bytes += size
+
+    def release(self, size: int) -> None:
+        self.used_bytes = max(0, self.used_bytes - size)
+        # 예산 부족으로 대기 중인 버퍼 깨우기
+        for waiter in self._waiters:
+            waiter.set()
+
+    def watch(self, waiter: asyncio.Event) -> None:
+        """예산 반납 시 깨울 대기자 등록"""
+        self._waiters.add(waiter)
+
+    def unwatch(self, waiter: asyncio.Event) -> None:
+        self._waiters.discard(waiter)
+
+    def register(self, buffer: "BoundedStreamBuffer") -> None:
+        self._buffers[buffer.stream_id] = buffer
+
+    def unregister(self, buffer: "BoundedStreamBuffer") -> None:
+        self._buffers.pop(buffer.stream_id, None)
+        self.peak_bytes_per_stream.observe(buffer.peak_bytes)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약 (전체 사용량, 스트림별 점유량)"""
+        return {
+            "budget_bytes": self.budget_bytes,
+            "used_bytes": self.used_bytes,
+            "active_streams": len(self._buffers),
+            "streams": {stream_id: buffer.occupancy() for stream_id, buffer in self._buffers.items()},
+            "peak_bytes_per_stream": self.peak_bytes_per_stream.snapshot(),
+        }
+
+
+class BoundedStreamBuffer:
+    """
+    스트림 단계 사이의 크기 제한 버퍼
+
+    이벤트 수(max_events)와 바이트(max_bytes), 전체 메모리 예산을 모두 만족할 때만 적재하며,
+    가득 찼을 때는 policy에 따라 생산자를 멈추거나(pause), 텍스트를 합치거나(coalesce),
+    제한 시간 후 스트림을 끊습니다(drop).
+    AgentExecutionState.streaming_queue 처럼 노드와 응답 사이의 큐로도 사용합니다.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        budget: StreamMemoryBudget,
+        max_events: int = 256,
+        max_bytes: int = 256 * 1024,
+        policy: str = POLICY_COALESCE,
+        drop_after: float = 30.0,
+    ):
+        self.stream_id = stream_id
+        self.budget = budget
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.policy = policy if policy in BUFFER_POLICIES else POLICY_COALESCE
+        self.drop_after = drop_after
+
+        self._items: Deque[Any] = deque()
+        self._sizes: Deque[int] = deque()
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.coalesced = 0
+        self._error: Optional[BaseException] = None
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        budget.register(self)
+
+    def occupancy(self) -> Dict[str, Any]:
+        return {
+            "events": len(self._items),
+            "bytes": self.bytes,
+            "max_events": self.max_events,
+            "max_bytes": self.max_bytes,
+            "peak_bytes": self.peak_bytes,
+            "coalesced": self.coalesced,
+            "policy": self.policy,
+        }
+
+    async def put(self, event: Dict[str, Any]) -> None:
+        """이벤트 적재 (정책에 따라 대기하거나 SlowConsumerError 발생)"""
+        size = estimate_event_size(event)
+        deadline = time.monotonic() + self.drop_after if self.policy == POLICY_DROP else None
+
+        while True:
+            if self._error is not None:
+                raise self._error
+            if self.policy == POLICY_COALESCE and self._try_coalesce(event, size):
+                return
+            if self._try_append(event, size):
+                return
+
+            # 공간(또는 전체 예산)이 생길 때까지 대기
+            self._writable.clear()
+            self.budget.watch(self._writable)
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                await asyncio.wait_for(self._writable.wait(), timeout)
+            except asyncio.TimeoutError:
+                error = SlowConsumerError(
+                    f"클라이언트 수신 지연으로 스트림 종료 ({self.drop_after}s) - {self.stream_id}"
+                )
+                self.fail(error)
+                raise error
+            finally:
+                self.budget.unwatch(self._writable)
+
+    def _has_room(self, size: int, new_event: bool) -> bool:
+        if new_event and len(self._items) >= self.max_events:
+            return False
+        # 빈 버퍼는 크기와 무관하게 1개 이벤트 허용 (진행 보장)
+        return not self._items or self.bytes + size <= self.max_bytes
+
+    def _reserve(self, size: int) -> bool:
+        if self.budget.try_reserve(size):
+            return True
+        if not self._items:
+            self.budget.force_reserve(size)
+            return True
+        return False
+
+    def _try_append(self, event: Dict[str, Any], size: int) -> bool:
+        if not self._has_room(size, new_event=True) or not self._reserve(size):
+            return False
+        self._items.append(event)
+        self._sizes.append(size)
+        self._grow(size)
+        return True
+
+    def _try_coalesce(self, event: Dict[str, Any], size: int) -> bool:
+        """이벤트 슬롯이 가득 찬 경우 마지막 text-delta(같은 필드의 data-field-delta)에 이어 붙이기"""
+        event_type = event.get("type")
+        if len(self._items) < self.max_events or event_type not in ("text-delta", "data-field-delta"):
+            return False
+        tail = self._items[-1]
+        if not isinstance(tail, dict) or tail.get("type") != event_type or tail.get("id") != event.get("id"):
+            return False
+        added = size - EVENT_OVERHEAD_BYTES
+        if not self._has_room(added, new_event=False) or not self._reserve(added):
+            return False
+        if event_type == "text-delta":
+            self._items[-1] = {**tail, "delta": tail["delta"] + event["delta"]}
+        else:
+            data = tail["data"]
+            self._items[-1] = {**tail, "data": {**data, "delta": data["delta"] + event["data"]["delta"]}}
+        self._sizes[-1] += added
+        self._grow(added)
+        self.coalesced += 1
+        return True
+
+    def _grow(self, size: int) -> None:
+        self.bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        self._readable.set()
+
+    def close(self) -> None:
+        """생산 종료 (남은 이벤트를 모두 읽으면 get()이 None 반환)"""
+        self._items.append(_END)
+        self._sizes.append(0)
+        self._readable.set()
+
+    def fail(self, error: BaseException) -> None:
+        """스트림 실패 처리 - 버퍼를 비우고 메모리 반납"""
+        self._error = error
+        self.budget.release(self.bytes)
+        self._items.clear()
+        self._sizes.clear()
+        self.bytes = 0
+        self._readable.set()
+        self._writable.set()
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """이벤트 꺼내기 (생산 종료 시 None)"""
+        while not self._items:
+            if self._error is not None:
+                raise self._error
+            self._readable.clear()
+            await self._readable.wait()
+
+        item = self._items.popleft()
+        size = self._sizes.popleft()
+        if item is _END:
+            return None
+        self.bytes -= size
+        self.budget.release(size)
+        self._writable.set()
+        return item
+
+    def dispose(self) -> None:
+        """버퍼 정리 (남은 예약 반납, 예산 추적 해제)"""
+        self.budget.release(self.bytes)
+        self._items.clear()
+        self._sizes.clear()
+        self.bytes = 0
+        self.budget.unregister(self)
+
+
+async def buffered(
+    events: AsyncGenerator[Dict[str, Any], None],
+    stream_id: str,
+    policy: Optional[str] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    업스트림 이벤트와 클라이언트 전송 사이에 크기 제한 버퍼 삽입
+
+    별도 태스크가 업스트림을 읽어 버퍼에 적재하고, 호출자는 버퍼에서 꺼내 전송합니다.
+    클라이언트가 느리면 버퍼 정책이 업스트림 읽기를 멈추거나 텍스트를 합치거나 스트림을 끊고,
+    drop 시에는 업스트림을 즉시 닫아 스케줄러 슬롯과 Azure 할당량을 반납합니다.
+
+    Args:
+        events: 원본 이벤트 제너레이터 (generate_chat_events)
+        stream_id: 점유량 조회용 스트림 식별자
+        policy: 버퍼 정책 (기본값: STREAM_BUFFER_POLICY)
+    """
+    buffer = BoundedStreamBuffer(
+        stream_id,
+        get_stream_budget(),
+        max_events=int(os.getenv("STREAM_BUFFER_MAX_EVENTS", "256")),
+        max_bytes=int(os.getenv("STREAM_BUFFER_MAX_BYTES", str(256 * 1024))),
+        policy=policy or os.getenv("STREAM_BUFFER_POLICY", POLICY_COALESCE),
+        drop_after=float(os.getenv("STREAM_DROP_AFTER_SECONDS", "30")),
+    )
+
+    async def pump():
+        try:
+            async for event in events:
+                await buffer.put(event)
+            buffer.close()
+        except SlowConsumerError as e:
+            logger.warning(str(e))
+        except Exception as e:
+            buffer.fail(e)
+        finally:
+            await events.aclose()
+
+    pump_task = asyncio.create_task(pump(), name=f"stream-pump-{stream_id}")
+    try:
+        while True:
+            event = await buffer.get()
+            if event is None:
+                return
+            yield event
+    finally:
+        pump_task.cancel()
+        await asyncio.gather(pump_task, return_exceptions=True)
+        buffer.dispose()
+
+
+# 싱글톤 인스턴스
+_stream_budget: Optional[StreamMemoryBudget] = None
+
+
+def get_stream_budget() -> StreamMemoryBudget:
+    """스트림 버퍼 메모리 예산 인스턴스 가져오기"""
+    global _stream_budget
+    if _stream_budget is None:
+        _stream_budget = StreamMemoryBudget(
+            budget_bytes=int(os.getenv("STREAM_BUFFER_BUDGET_BYTES", str(64 * 1024 * 1024)))
+        )
+    return _stream_budget
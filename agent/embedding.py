@@ -0,0 +1,209 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set
+import openai
+from langchain_openai import AzureOpenAIEmbeddings
+from api.core.logger import APILogger
+from api.core.metrics import Histogram
+from config.settings import get_config
+
+logger = APILogger()
+config = get_config()
+
+DEFAULT_EMBEDDER = "text-embedding-3-large"
+
+
+class EmbeddingBatcher:
+    """
+    임베딩 요청 마이크로 배칭
+
+    동시에 처리 중인 채팅들의 임베딩 요청을 짧은 시간(window_ms) 동안 모았다가
+    (또는 max_batch개가 모이면 즉시) 한 번의 API 호출로 보내고, 각 호출자에게 자신의 벡터를 돌려줍니다.
+    같은 배치 안의 동일한 텍스트는 한 번만 요청합니다.
+    배치가 입력 오류(400 등)로 거부되면 텍스트별로 다시 요청하여, 다른 대화의 잘못된 입력 때문에
+    관련 없는 호출자까지 실패하지 않도록 합니다. 속도 제한(429), 타임아웃, 연결 오류 등은
+    재요청하면 부하만 늘어나므로 배치의 모든 호출자에게 원래 에러를 그대로 전달합니다.
+    """
+
+    def __init__(self, embedder: Any, window_ms: float = 5.0, max_batch: int = 64):
+        """
+        Args:
+            embedder: aembed_documents(texts)를 제공하는 임베딩 클라이언트
+            window_ms: 요청을 모으는 최대 대기 시간
+            max_batch: 한 번에 보낼 최대 고유 텍스트 수
+        """
+        self.embedder = embedder
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+        # 텍스트 → 결과를 기다리는 호출자들
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+        self.batch_size = Histogram(buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256))
+        self.requests = 0
+        self.deduplicated = 0
+        self.fallbacks = 0  # 입력 오류로 배치가 거부되어 텍스트별 재요청한 횟수
+
+    async def embed(self, text: str) -> List[float]:
+        """텍스트 하나의 임베딩 (다른 요청과 함께 배치 전송)"""
+        if not text:
+            raise ValueError("빈 텍스트는 임베딩할 수 없습니다.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests += 1
+
+        waiters = self._pending.get(text)
+        if waiters is not None:
+            self.deduplicated += 1
+            waiters.append(future)
+        else:
+            self._pending[text] = [future]
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트의 임베딩 (입력 순서 유지)"""
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        # 태스크가 GC되지 않도록 완료 전까지 참조 유지
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        texts = list(batch)
+        self.batch_size.observe(len(texts))
+        if len(texts) == 1:
+            await self._send_one(texts[0], batch[texts[0]])
+            return
+
+        try:
+            vectors = await self._embed(texts)
+        except Exception as e:
+            if not _is_input_error(e):
+                logger.error(f"임베딩 배치 요청 실패 ({len(texts)}건): {e}")
+                for waiters in batch.values():
+                    _reject(waiters, e)
+                return
+            # 배치 내 일부 입력 때문이므로 텍스트별로 재요청해 각자 자신의 결과/에러만 받도록 함
+            logger.warning(f"임베딩 배치 입력 오류 ({len(texts)}건), 텍스트별 재요청: {e}")
+            self.fallbacks += 1
+            await asyncio.gather(*(self._send_one(text, batch[text]) for text in texts))
+            return
+
+        for text, vector in zip(texts, vectors):
+            _resolve(batch[text], vector)
+
+    async def _send_one(self, text: str, waiters: List[asyncio.Future]) -> None:
+        try:
+            vector = (await self._embed([text]))[0]
+        except Exception as e:
+            logger.error(f"임베딩 요청 실패: {e}")
+            _reject(waiters, e)
+            return
+        _resolve(waiters, vector)
+
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = await self.embedder.aembed_documents(texts)
+        if len(vectors) != len(texts):
+            # 결과가 부족하면 남은 호출자가 영원히 대기하므로 실패로 처리
+            raise ValueError(f"임베딩 결과 수 불일치 (요청 {len(texts)}건, 응답 {len(vectors)}건)")
+        return vectors
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약 (요청 수, 중복 제거 수, 배치 크기 분포)"""
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "fallbacks": self.fallbacks,
+            "batch_size": self.batch_size.snapshot(),
+        }
+
+
+# 특정 입력 때문에 거부된 요청의 상태 코드 (인증/속도 제한 등은 텍스트를 나눠도 결과가 같음)
+_INPUT_ERROR_STATUSES = frozenset({400, 413, 422})
+
+
+def _is_input_error(error: Exception) -> bool:
+    return isinstance(error, openai.APIStatusError) and error.status_code in _INPUT_ERROR_STATUSES
+
+
+def _resolve(waiters: List[asyncio.Future], vector: List[float]) -> None:
+    for future in waiters:
+        # 대기 중 취소된 호출자는 건너뜀
+        if not future.done():
+            future.set_result(vector)
+
+
+def _reject(waiters: List[asyncio.Future], error: Exception) -> None:
+    for future in waiters:
+        if not future.done():
+            future.set_exception(error)
+
+
+# 임베딩 모델(배포)별 인스턴스
+_batchers: Dict[str, EmbeddingBatcher] = {}
+
+
+def get_embedding_batcher(embedder_name: str = DEFAULT_EMBEDDER) -> EmbeddingBatcher:
+    """
+    임베딩 배처 인스턴스 가져오기
+
+    Args:
+        embedder_name: 임베딩 배포명 (AgentExecutionState.embedder_name)
+    """
+    batcher = _batchers.get(embedder_name)
+    if batcher is None:
+        embedder = AzureOpenAIEmbeddings(
+            azure_deployment=embedder_name,
+            api_key=config.get("agent-azure-openai-api-key"),
+            api_version=config.get("agent-azure-openai-api-version"),
+            azure_endpoint=config.get("agent-azure-openai-endpoint"),
+            max_retries=3,
+            # 질의는 짧으므로 tiktoken 토큰화 생략 (이벤트 루프 블로킹 방지)
+            check_embedding_ctx_length=False,
+        )
+        batcher = EmbeddingBatcher(
+            embedder,
+            window_ms=float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5")),
+            max_batch=int(os.getenv("EMBEDDING_MAX_BATCH", "64")),
+        )
+        _batchers[embedder_name] = batcher
+        logger.info(f">>>> Load Embedding Model Name : {embedder_name}")
+    return batcher
+
+
+def embedding_snapshot() -> Dict[str, Any]:
+    """조회용 요약 (임베딩 모델별 배치 통계)"""
+    return {name: batcher.snapshot() for name, batcher in _batchers.items()}
+
+
+def _reset_batchers(changed_keys: List[str]):
+    """Azure OpenAI 관련 키 로테이션 시 임베딩 클라이언트 재생성 (진행 중인 배치는 기존 클라이언트 유지)"""
+    if any(key.startswith("agent-azure-openai-") for key in changed_keys):
+        _batchers.clear()
+
+
+config.add_rotation_listener(_reset_batchers)
+
+
+async def aembed_query(text: str, embedder_name: str = DEFAULT_EMBEDDER) -> List[float]:
+    """질의 임베딩 (동시 요청과 자동 배치)"""
+    return await get_embedding_batcher(embedder_name).embed(text)
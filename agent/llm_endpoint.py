@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Dict, List, Optional
 from functools import wraps
 from langchain_openai import AzureChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -6,6 +6,40 @@ from config.settings import get_config
 from api.core.logger import APILogger
 
 logger = APILogger()
+config = get_config()
+
+DEFAULT_ERROR_MESSAGE = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+
+# 배포(deployment)별 AzureChatOpenAI 클라이언트 풀 (HTTP 커넥션 재사용)
+_llm_pool: Dict[str, AzureChatOpenAI] = {}
+
+
+def _get_pooled_llm(deployment: str) -> AzureChatOpenAI:
+    """배포별로 공유되는 LLM 클라이언트 반환 (없으면 생성)"""
+    llm = _llm_pool.get(deployment)
+    if llm is None:
+        llm = AzureChatOpenAI(
+            model=deployment,
+            api_key=config.get("agent-azure-openai-api-key"),
+            api_version=config.get("agent-azure-openai-api-version"),
+            azure_endpoint=config.get("agent-azure-openai-endpoint"),
+            streaming=True,
+            max_retries=3,
+            # reasoning_effort="minimal",
+        )
+        _llm_pool[deployment] = llm
+        logger.info(f">>>> Load Model Name : {llm.model_name}")
+    return llm
+
+
+def _reset_llm_pool(changed_keys: List[str]):
+    """Azure OpenAI 관련 키 로테이션 시 클라이언트 풀 재생성 (진행 중인 요청은 기존 클라이언트 유지)"""
+    if any(key.startswith("agent-azure-openai-") for key in changed_keys):
+        _llm_pool.clear()
+        logger.info("Azure OpenAI 키 변경 - LLM 클라이언트 풀 초기화")
+
+
+config.add_rotation_listener(_reset_llm_pool)
 
 
 class LLMInvokeException(Exception):
@@ -41,22 +75,13 @@ class SafeLLMWrapper:
         'with_listeners'
     }
     
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, deployment: Optional[str] = None):
         """
         Args:
             model_name: 사용할 모델명
+            deployment: Azure OpenAI 배포명 (기본값: agent-azure-openai-model-name)
         """
-        config = get_config()
-        self._llm = AzureChatOpenAI(
-            model=config.get("agent-azure-openai-model-name"),
-            api_key=config.get("agent-azure-openai-api-key"),
-            api_version=config.get("agent-azure-openai-api-version"),
-            azure_endpoint=config.get("agent-azure-openai-endpoint"),
-            streaming=True,
-            max_retries=3,
-            # reasoning_effort="minimal",
-        )
-        logger.info(f">>>> Load Model Name : {self._llm.model_name}")
+        self._llm = _get_pooled_llm(deployment or config.get("agent-azure-openai-model-name"))
         self._model_name = model_name
         
         # 위 self._llm은 'with_structured_output'등 적용으로 변경될 수 있어, 에러메세지 생성용 초기 LLM 보관
@@ -88,7 +113,7 @@ class SafeLLMWrapper:
             except Exception as e:
                 logger.error(f">>> {method.__name__} 실행 에러: {e}")
                 user_query = self._extract_user_query(args, kwargs)
-                self._handle_bad_request(e, user_query)
+                await self._ahandle_bad_request(e, user_query)
         
         # async 메서드인지 확인
         import inspect
@@ -176,26 +201,50 @@ class SafeLLMWrapper:
     
     def _handle_bad_request(self, error: Exception, user_query: str):
         """Invoke Error 처리"""
-        error_str = str(error)
-        error_type = type(error).__name__
-        error_code = getattr(error, "status_code", None)
         try:
-            generate_message = self.generate_error_message(error_type, error_str)
+            generate_message = self.generate_error_message(type(error).__name__, str(error))
+        except Exception as gen_error:
+            logger.error(f">>> Error generating friendly message: {gen_error}")
+            generate_message = DEFAULT_ERROR_MESSAGE
+
+        self._raise_invoke_exception(error, user_query, generate_message)
+
+    async def _ahandle_bad_request(self, error: Exception, user_query: str):
+        """Invoke Error 처리 (async) - 이벤트 루프를 막지 않도록 에러 메시지도 비동기로 생성"""
+        try:
+            generate_message = await self.agenerate_error_message(type(error).__name__, str(error))
         except Exception as gen_error:
             logger.error(f">>> Error generating friendly message: {gen_error}")
-            generate_message = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+            generate_message = DEFAULT_ERROR_MESSAGE
 
+        self._raise_invoke_exception(error, user_query, generate_message)
+
+    def _raise_invoke_exception(self, error: Exception, user_query: str, generate_message: str):
         raise LLMInvokeException(
             message=generate_message,
-            error_type=error_type,
+            error_type=type(error).__name__,
             original_error=error,
             user_query=user_query,
-            error_code=error_code,
+            error_code=getattr(error, "status_code", None),
             additional_info={"model": self._model_name},
         )
     
     def generate_error_message(self, error_type: str, error_string: str) -> str:
         """에러 메시지를 사용자 친화적으로 생성"""
+        messages = self._build_error_message_prompt(error_type, error_string)
+        # 변경 가능성이 존재하는 LLM(with_structured_output 등 적용 가능성)이 아닌 최초 LLM 사용
+        response = self._base_llm.invoke(messages)
+        return response.content.strip()
+
+    async def agenerate_error_message(self, error_type: str, error_string: str) -> str:
+        """에러 메시지를 사용자 친화적으로 생성 (async)"""
+        messages = self._build_error_message_prompt(error_type, error_string)
+        # 변경 가능성이 존재하는 LLM(with_structured_output 등 적용 가능성)이 아닌 최초 LLM 사용
+        response = await self._base_llm.ainvoke(messages)
+        return response.content.strip()
+
+    def _build_error_message_prompt(self, error_type: str, error_string: str) -> list:
+        """에러 안내 문구 생성용 프롬프트"""
         system_prompt = """당신은 보험 상담 AI 어시스턴트입니다.
 현재 고객의 질문을 처리하는 중 기술적인 문제가 발생했습니다.
 고객에게 상황을 정중하고 친절하게 설명하고, 적절한 대안을 제시해야 합니다.
@@ -221,15 +270,12 @@ class SafeLLMWrapper:
 
 위 정보를 바탕으로, 고객에게 보낼 친절하고 정중한 안내 문구를 2-3문장으로 작성해주세요.
 """
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_message)
         ]
-        # 변경 가능성이 존재하는 LLM(with_structured_output 등 적용 가능성)이 아닌 최초 LLM 사용
-        response = self._base_llm.invoke(messages)
-        return response.content.strip()
 
 
-def get_safe_llm(model_name: str = "gpt-4o") -> SafeLLMWrapper:
+def get_safe_llm(model_name: str = "gpt-4o", deployment: Optional[str] = None) -> SafeLLMWrapper:
     """안전한 LLM 인스턴스 반환"""
-    return SafeLLMWrapper(model_name=model_name)
\ No newline at end of file
+    return SafeLLMWrapper(model_name=model_name, deployment=deployment)
\ No newline at end of file
@@ -0,0 +1,342 @@
+"""
+증분 JSON 파서 (구조화 응답 스트리밍용)
+
+모델이 도구 호출 인자로 스트리밍하는 JSON 조각을 받은 순서대로 한 번만 읽어(전체 O(n))
+문자열 값은 도착한 만큼 delta로, 값(문자열/숫자/객체/배열 등)은 완성되는 즉시 value로 알려줍니다.
+매 청크마다 누적 문자열 전체를 다시 파싱하는 방식(O(n²))을 대체합니다.
+"""
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+# 이벤트 종류
+DELTA = "delta"  # 작성 중인 문자열 값에 새로 도착한 텍스트
+VALUE = "value"  # 완성된 값
+
+# 파서 상태
+_EXPECT_VALUE = 0
+_ARRAY_FIRST = 1  # "[" 직후 (값 또는 "]")
+_OBJECT_FIRST = 2  # "{" 직후 (키 또는 "}")
+_OBJECT_KEY = 3  # "," 직후 키
+_OBJECT_COLON = 4
+_AFTER_VALUE = 5
+_IN_STRING = 6
+_IN_NUMBER = 7
+_IN_LITERAL = 8
+_DONE = 9
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+PathKey = Union[str, int]
+
+
+class PartialJSONError(ValueError):
+    """JSON 형식이 올바르지 않거나 입력이 완결되지 않은 경우"""
+
+
+@dataclass
+class PartialEvent:
+    """
+    파서 이벤트
+
+    Attributes:
+        kind: DELTA 또는 VALUE
+        path: 루트부터의 경로 (객체 키 / 배열 인덱스), 루트 값은 ()
+        value: DELTA는 새로 도착한 텍스트, VALUE는 완성된 값
+    """
+    kind: str
+    path: Tuple[PathKey, ...]
+    value: Any
+
+
+class IncrementalJSONParser:
+    """
+    JSON 문자열을 청크 단위로 입력받아 값이 완성되는 대로 이벤트를 생성하는 파서
+
+    각 문자는 한 번만 처리하며, 문자열 본문은 정규식으로 구간 단위 복사합니다.
+    완성된 객체/배열은 하위 값을 채워 가며 만든 것을 그대로 반환하므로 다시 파싱하지 않습니다.
+
+    Example:
+        parser = IncrementalJSONParser()
+        for fragment in fragments:
+            for event in parser.feed(fragment):
+                ...
+        result = parser.close()
+    """
+
+    def __init__(self):
+        self._state = _EXPECT_VALUE
+        # 작성 중인 컨테이너와 그 경로
+        self._containers: List[Union[dict, list]] = []
+        self._container_paths: List[Tuple[PathKey, ...]] = []
+        # 현재 위치의 경로 (객체는 현재 키, 배열은 현재 인덱스)
+        self._path: List[Optional[PathKey]] = []
+
+        self._parts: List[str] = []  # 작성 중인 문자열/숫자 토큰
+        self._delta_from = 0  # 아직 delta로 보내지 않은 _parts 시작 위치
+        self._is_key = False
+        self._escape = ""  # 청크 경계에 걸친 이스케이프 시퀀스
+        self._literal: Tuple[str, Any] = ("", None)
+        self._literal_length = 0
+
+        self._root: Any = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    @property
+    def value(self) -> Any:
+        """완성된 루트 값 (완성 전에는 None)"""
+        return self._root
+
+    def feed(self, chunk: str) -> List[PartialEvent]:
+        """
+        JSON 조각 입력
+
+        Args:
+            chunk: 이어지는 JSON 텍스트 조각
+
+        Returns:
+            List[PartialEvent]: 이 조각으로 새로 생긴 이벤트 (문자열 delta는 조각마다 최대 1개)
+        """
+        events: List[PartialEvent] = []
+        i, length = 0, len(chunk)
+        while i < length:
+            state = self._state
+            if state == _IN_STRING:
+                i = self._scan_string(chunk, i, events)
+                continue
+
+            char = chunk[i]
+            if state == _IN_NUMBER:
+                if char in _NUMBER_CHARS:
+                    self._parts.append(char)
+                    i += 1
+                else:
+                    # 숫자 종료 - 현재 문자는 다음 상태에서 다시 처리
+                    self._finish_number(events)
+                continue
+            if state == _IN_LITERAL:
+                self._feed_literal(char, events)
+                i += 1
+                continue
+
+            i += 1
+            if char in _WHITESPACE:
+                continue
+            if state == _EXPECT_VALUE:
+                self._start_value(char, events)
+            elif state == _ARRAY_FIRST:
+                if char == "]":
+                    self._close_container("]", events)
+                else:
+                    self._start_value(char, events)
+            elif state == _OBJECT_FIRST and char == "}":
+                self._close_container("}", events)
+            elif state in (_OBJECT_FIRST, _OBJECT_KEY) and char == '"':
+                self._start_string(is_key=True)
+            elif state == _OBJECT_COLON and char == ":":
+                self._state = _EXPECT_VALUE
+            elif state == _AFTER_VALUE:
+                self._after_value(char, events)
+            else:
+                raise PartialJSONError(f"예상하지 못한 문자 {char!r}")
+
+        if self._state == _IN_STRING and not self._is_key:
+            self._emit_delta(events)
+        return events
+
+    def close(self) -> Any:
+        """
+        입력 종료
+
+        Returns:
+            Any: 완성된 루트 값
+
+        Raises:
+            PartialJSONError: JSON이 완결되지 않은 경우
+        """
+        if self._state == _IN_NUMBER and not self._containers:
+            self._finish_number([])
+        if self._state != _DONE:
+            raise PartialJSONError("JSON이 완결되지 않았습니다.")
+        return self._root
+
+    # 값 시작/종료
+
+    def _start_value(self, char: str, events: List[PartialEvent]) -> None:
+        if char == "{":
+            self._push_container({})
+            self._state = _OBJECT_FIRST
+        elif char == "[":
+            self._push_container([])
+            self._state = _ARRAY_FIRST
+        elif char == '"':
+            self._start_string(is_key=False)
+        elif char == "-" or char.isdigit():
+            self._parts = [char]
+            self._state = _IN_NUMBER
+        elif char in _LITERALS:
+            self._literal = _LITERALS[char]
+            self._literal_length = 1
+            self._state = _IN_LITERAL
+        else:
+            raise PartialJSONError(f"예상하지 못한 문자 {char!r}")
+
+    def _push_container(self, container: Union[dict, list]) -> None:
+        self._containers.append(container)
+        self._container_paths.append(tuple(self._path))
+        self._path.append(0 if isinstance(container, list) else None)
+
+    def _close_container(self, char: str, events: List[PartialEvent]) -> None:
+        container = self._containers[-1]
+        if (char == "]") != isinstance(container, list):
+            raise PartialJSONError(f"괄호가 맞지 않습니다: {char!r}")
+        self._containers.pop()
+        self._path.pop()
+        self._complete(container, self._container_paths.pop(), events)
+
+    def _after_value(self, char: str, events: List[PartialEvent]) -> None:
+        if not self._containers:
+            raise PartialJSONError(f"루트 값 이후 예상하지 못한 문자 {char!r}")
+        if char == ",":
+            if isinstance(self._containers[-1], list):
+                self._path[-1] += 1
+                self._state = _EXPECT_VALUE
+            else:
+                self._state = _OBJECT_KEY
+        elif char in "]}":
+            self._close_container(char, events)
+        else:
+            raise PartialJSONError(f"예상하지 못한 문자 {char!r}")
+
+    def _complete(self, value: Any, path: Tuple[PathKey, ...], events: List[PartialEvent]) -> None:
+        """값 완성 - 부모 컨테이너에 연결하고 VALUE 이벤트 추가"""
+        if self._containers:
+            parent = self._containers[-1]
+            if isinstance(parent, list):
+                parent.append(value)
+            else:
+                parent[self._path[-1]] = value
+            self._state = _AFTER_VALUE
+        else:
+            self._root = value
+            self._state = _DONE
+        events.append(PartialEvent(VALUE, path, value))
+
+    # 스칼라
+
+    def _finish_number(self, events: List[PartialEvent]) -> None:
+        token = "".join(self._parts)
+        self._parts = []
+        try:
+            value = json.loads(token)
+        except ValueError:
+            raise PartialJSONError(f"잘못된 숫자: {token!r}")
+        self._complete(value, tuple(self._path), events)
+
+    def _feed_literal(self, char: str, events: List[PartialEvent]) -> None:
+        text, value = self._literal
+        if char != text[self._literal_length]:
+            raise PartialJSONError(f"잘못된 리터럴 (기대값: {text})")
+        self._literal_length += 1
+        if self._literal_length == len(text):
+            self._complete(value, tuple(self._path), events)
+
+    # 문자열
+
+    def _start_string(self, is_key: bool) -> None:
+        self._parts = []
+        self._delta_from = 0
+        self._is_key = is_key
+        self._state = _IN_STRING
+
+    def _scan_string(self, chunk: str, i: int, events: List[PartialEvent]) -> int:
+        """문자열 본문 처리 후 다음 읽을 위치 반환"""
+        if self._escape:
+            return self._scan_escape(chunk, i)
+
+        match = _STRING_SPECIAL.search(chunk, i)
+        end = match.start() if match else len(chunk)
+        if end > i:
+            self._parts.append(chunk[i:end])
+        if match is None:
+            return end
+        if chunk[end] == "\\":
+            self._escape = "\\"
+        else:
+            self._finish_string(events)
+        return end + 1
+
+    def _scan_escape(self, chunk: str, i: int) -> int:
+        """
+        이스케이프 시퀀스 한 글자 처리 (청크 경계에 걸쳐도 이어서 처리)
+
+        서로게이트 쌍(\\uD83D\\uDE00)은 두 시퀀스를 모두 받은 뒤 한 글자로 합치고,
+        짝이 없는 서로게이트는 U+FFFD로 바꿉니다.
+        """
+        char = chunk[i]
+        escape = self._escape + char
+        size = len(escape)
+
+        if size == 2:
+            if char == "u":
+                self._escape = escape
+                return i + 1
+            if char not in _ESCAPES:
+                raise PartialJSONError(f"잘못된 이스케이프: \\{char}")
+            self._parts.append(_ESCAPES[char])
+            self._escape = ""
+            return i + 1
+
+        if size in (7, 8) and char != "\\u"[size - 7]:
+            # 상위 서로게이트 뒤에 하위 서로게이트가 오지 않음 - 현재 문자는 다시 처리
+            self._parts.append("\ufffd")
+            self._escape = "\\" if size == 8 else ""
+            return i
+
+        if size <= 6 or size > 8:
+            if char not in _HEX_DIGITS:
+                raise PartialJSONError(f"잘못된 유니코드 이스케이프: {escape}")
+        self._escape = escape
+        if size == 6:
+            code = int(escape[2:], 16)
+            if 0xD800 <= code < 0xDC00:
+                # 하위 서로게이트 대기
+                return i + 1
+            self._parts.append("\ufffd" if 0xDC00 <= code < 0xE000 else chr(code))
+            self._escape = ""
+        elif size == 12:
+            high, low = int(escape[2:6], 16), int(escape[8:], 16)
+            if 0xDC00 <= low < 0xE000:
+                self._parts.append(chr(0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00)))
+            else:
+                self._parts.append("\ufffd" + ("\ufffd" if 0xD800 <= low < 0xE000 else chr(low)))
+            self._escape = ""
+        return i + 1
+
+    def _emit_delta(self, events: List[PartialEvent]) -> None:
+        if self._delta_from < len(self._parts):
+            delta = "".join(self._parts[self._delta_from:])
+            self._delta_from = len(self._parts)
+            if delta:
+                events.append(PartialEvent(DELTA, tuple(self._path), delta))
+
+    def _finish_string(self, events: List[PartialEvent]) -> None:
+        if self._is_key:
+            self._path[-1] = "".join(self._parts)
+            self._parts = []
+            self._state = _OBJECT_COLON
+            return
+
+        self._emit_delta(events)
+        value = "".join(self._parts)
+        self._parts = []
+        self._complete(value, tuple(self._path), events)
@@ -0,0 +1,206 @@
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+from agent.schema.chat import Message
+from api.core.logger import APILogger
+from api.core.metrics import Histogram
+from config.settings import get_config
+
+logger = APILogger()
+config = get_config()
+
+TIER_FAST = "fast"
+TIER_LARGE = "large"
+
+# 복잡한 요청으로 판단하는 키워드 (비교/분석/계산/약관 해석 등)
+# "왜", "어떻게"처럼 대부분의 FAQ 질문에 들어가는 단어는 제외 (fast 티어로 거의 가지 않게 됨)
+COMPLEX_KEYWORDS = (
+    "비교", "분석", "계산", "차이", "추천", "장단점", "약관", "보장 내용",
+    "청구 절차", "설명해", "요약", "시뮬레이션", "예시",
+)
+
+
+def last_user_query(messages: List[Message]) -> str:
+    """라우팅 판단 기준이 되는 마지막 사용자 메시지"""
+    return next((msg.content for msg in reversed(messages) if msg.role == "user"), "")
+
+
+@dataclass
+class TierRoute:
+    """
+    티어별 라우팅 설정
+
+    Attributes:
+        deployment: Azure OpenAI 배포명
+        max_chars: 이 티어로 보낼 수 있는 마지막 사용자 메시지 최대 길이
+        max_history: 이 티어로 보낼 수 있는 최대 대화 메시지 수
+    """
+    deployment: str
+    max_chars: int = 0
+    max_history: int = 0
+
+
+@dataclass
+class RouteDecision:
+    tier: str
+    deployment: str
+    reasons: List[str] = field(default_factory=list)
+
+
+class ModelTierRouter:
+    """
+    요청 복잡도 기반 모델 티어 라우터
+
+    마지막 사용자 메시지 길이, 대화 이력 길이, 키워드/형식 규칙(선택적으로 CPU 분류 모델)을 사용해
+    단순한 요청은 빠른 배포(fast)로, 복잡한 요청은 기본 대형 배포(large)로 보냅니다.
+    하나라도 복잡 조건에 걸리면 large로 보내 품질 저하 위험을 줄입니다.
+
+    티어별 지연 시간(첫 토큰/전체)을 기록하고, fast 티어 응답 일부를 샘플링해
+    라우팅 정확도 검토와 임계값 조정에 사용합니다.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, TierRoute],
+        enabled: bool = True,
+        sample_rate: float = 0.05,
+        classifier: Optional[Callable[[str], float]] = None,
+    ):
+        self.routes = routes
+        self.enabled = enabled and TIER_FAST in routes
+        self.sample_rate = sample_rate
+        # 선택: 복잡할 확률(0~1)을 반환하는 로컬 분류기 (예: 소형 CPU 모델)
+        self.classifier = classifier
+
+        self.requests: Dict[str, int] = {tier: 0 for tier in routes}
+        self.first_token_ms: Dict[str, Histogram] = {tier: Histogram() for tier in routes}
+        self.total_ms: Dict[str, Histogram] = {tier: Histogram() for tier in routes}
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=200)
+
+    def route(self, messages: List[Message]) -> RouteDecision:
+        """요청을 분류해 티어와 배포 결정"""
+        large = self.routes[TIER_LARGE]
+        if not self.enabled:
+            return RouteDecision(tier=TIER_LARGE, deployment=large.deployment, reasons=["router_disabled"])
+
+        reasons = self._complexity_reasons(messages)
+        tier = TIER_LARGE if reasons else TIER_FAST
+        return RouteDecision(tier=tier, deployment=self.routes[tier].deployment, reasons=reasons)
+
+    def _complexity_reasons(self, messages: List[Message]) -> List[str]:
+        fast = self.routes[TIER_FAST]
+        query = last_user_query(messages)
+        reasons = []
+
+        if len(query) > fast.max_chars:
+            reasons.append("length")
+        if len(messages) > fast.max_history:
+            reasons.append("history")
+        keyword = next((keyword for keyword in COMPLEX_KEYWORDS if keyword in query), None)
+        if keyword:
+            reasons.append(f"keyword:{keyword}")
+        if query.count("?") >= 2:
+            reasons.append("multi_question")
+        if "```" in query or "|" in query:
+            reasons.append("structured_input")
+        if not reasons and self.classifier is not None:
+            try:
+                if self.classifier(query) >= 0.5:
+                    reasons.append("classifier")
+            except Exception as e:
+                logger.error(f"라우팅 분류기 실행 실패: {e}")
+                reasons.append("classifier_error")
+        return reasons
+
+    def record(
+        self,
+        decision: RouteDecision,
+        first_token_ms: Optional[float],
+        total_ms: float,
+        query: str,
+        response: str,
+    ) -> None:
+        """티어별 지연 시간 기록 및 fast 티어 응답 샘플링"""
+        self.requests[decision.tier] += 1
+        if first_token_ms is not None:
+            self.first_token_ms[decision.tier].observe(first_token_ms)
+        self.total_ms[decision.tier].observe(total_ms)
+
+        if decision.tier == TIER_FAST and random.random() < self.sample_rate:
+            self.samples.append(
+                {
+                    "at": time.time(),
+                    "deployment": decision.deployment,
+                    "query": query[:500],
+                    "response": response[:1000],
+                    "total_ms": round(total_ms, 1),
+                }
+            )
+
+    def update(self, **settings) -> None:
+        """관리자 API에서 임계값 변경"""
+        fast = self.routes.get(TIER_FAST)
+        if settings.get("enabled") is not None:
+            self.enabled = settings["enabled"] and fast is not None
+        if settings.get("sample_rate") is not None:
+            self.sample_rate = settings["sample_rate"]
+        if fast is not None:
+            if settings.get("max_fast_chars") is not None:
+                fast.max_chars = settings["max_fast_chars"]
+            if settings.get("max_fast_history") is not None:
+                fast.max_history = settings["max_fast_history"]
+        logger.info(f"모델 라우터 설정 변경: {self.settings()}")
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "routes": {
+                tier: {"deployment": route.deployment, "max_chars": route.max_chars, "max_history": route.max_history}
+                for tier, route in self.routes.items()
+            },
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약 (설정, 티어별 요청 수/지연 시간, 샘플)"""
+        return {
+            "settings": self.settings(),
+            "requests": dict(self.requests),
+            "first_token_ms": {tier: histogram.snapshot() for tier, histogram in self.first_token_ms.items()},
+            "total_ms": {tier: histogram.snapshot() for tier, histogram in self.total_ms.items()},
+            "samples": list(self.samples),
+        }
+
+
+# 싱글톤 인스턴스
+_model_router: Optional[ModelTierRouter] = None
+
+
+def get_model_router() -> ModelTierRouter:
+    """모델 티어 라우터 인스턴스 가져오기 (MODEL_TIER_FAST_DEPLOYMENT 미설정 시 항상 large)"""
+    global _model_router
+    if _model_router is None:
+        routes = {TIER_LARGE: TierRoute(deployment=config.get("agent-azure-openai-model-name"))}
+        fast_deployment = os.getenv("MODEL_TIER_FAST_DEPLOYMENT")
+        if fast_deployment:
+            routes[TIER_FAST] = TierRoute(
+                deployment=fast_deployment,
+                max_chars=int(os.getenv("MODEL_ROUTER_MAX_FAST_CHARS", "200")),
+                max_history=int(os.getenv("MODEL_ROUTER_MAX_FAST_HISTORY", "6")),
+            )
+        _model_router = ModelTierRouter(
+            routes,
+            enabled=os.getenv("MODEL_ROUTER_ENABLED", "true").lower() == "true",
+            sample_rate=float(os.getenv("MODEL_ROUTER_SAMPLE_RATE", "0.05")),
+        )
+        config.add_rotation_listener(_on_config_rotated)
+    return _model_router
+
+
+def _on_config_rotated(changed_keys: List[str]):
+    """기본 배포명이 바뀌면 large 티어 배포 갱신"""
+    if "agent-azure-openai-model-name" in changed_keys and _model_router is not None:
+        _model_router.routes[TIER_LARGE].deployment = config.get("agent-azure-openai-model-name")
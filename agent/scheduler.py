@@ -0,0 +1,281 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from api.core.logger import APILogger
+from api.core.metrics import Histogram
+
+logger = APILogger()
+
+# 우선순위 클래스
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, BATCH)
+
+# user_no 없는 요청의 대기열 (요청마다 별도 대기열을 만들면 공정 분배를 우회하므로 하나로 묶음)
+# 프론트엔드 프록시를 거친 UI 사용자가 모두 여기에 속하므로 사용자별 제한 대신 anonymous_limit 적용
+ANONYMOUS_USER = "anonymous"
+
+
+class SchedulerTimeoutError(Exception):
+    """대기열에서 제한 시간 내에 실행 슬롯을 받지 못한 경우"""
+
+
+@dataclass
+class _Waiter:
+    user_no: str
+    priority: str
+    cost: float
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class FairScheduler:
+    """
+    사용자별 가중 공정 스케줄러 (LLM 호출 앞단)
+
+    - 전체 동시 실행 수(max_concurrency)와 사용자별 동시 실행 수(per_user_limit) 제한
+      (user_no 없는 요청은 하나의 익명 대기열로 묶고 anonymous_limit 적용)
+    - 우선순위 클래스(interactive / batch) 간에는 클래스 가중치로 슬롯을 나누고,
+      batch는 전체 슬롯의 batch_max_share까지만 사용하여 interactive 요청용 여유를 남김
+    - 같은 클래스 안에서는 사용자별 대기열을 Deficit Round Robin으로 순회하여
+      한 사용자가 대기열을 가득 채워도 다른 사용자가 굶지 않도록 함
+    - 클래스별 대기 시간을 히스토그램으로 기록
+
+    워커 프로세스마다 독립적으로 동작하므로 멀티 워커 환경에서는
+    max_concurrency를 워커 수로 나눈 값으로 설정합니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        per_user_limit: int = 4,
+        batch_max_share: float = 0.5,
+        class_weights: Optional[Dict[str, float]] = None,
+        user_weights: Optional[Dict[str, float]] = None,
+        quantum: float = 1.0,
+        anonymous_limit: Optional[int] = None,
+    ):
+        if quantum <= 0:
+            raise ValueError(f"quantum은 0보다 커야 합니다: {quantum}")
+        self.max_concurrency = max_concurrency
+        self.per_user_limit = per_user_limit
+        # 기본값: 익명 대기열은 전체 슬롯까지 사용 가능 (식별된 사용자와는 DRR로 공정 분배)
+        self.anonymous_limit = anonymous_limit if anonymous_limit is not None else max_concurrency
+        self.batch_max_share = batch_max_share
+        self.class_weights = _positive_weights(class_weights or {INTERACTIVE: 8.0, BATCH: 1.0}, "클래스")
+        # 가중치가 0 이하이면 DRR deficit이 늘지 않아 _next_waiter가 끝나지 않으므로 제외 (기본값 1 적용)
+        self.user_weights = _positive_weights(user_weights or {}, "사용자")
+        self.quantum = quantum
+
+        # 클래스별 사용자 대기열 (OrderedDict 순서 = 라운드 로빈 순서)
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in PRIORITY_CLASSES
+        }
+        self._deficits: Dict[str, Dict[str, float]] = {priority: {} for priority in PRIORITY_CLASSES}
+        # 클래스 선택용 (smooth weighted round robin)
+        self._class_credits: Dict[str, float] = {priority: 0.0 for priority in PRIORITY_CLASSES}
+
+        self._running = 0
+        self._running_by_class: Dict[str, int] = {priority: 0 for priority in PRIORITY_CLASSES}
+        self._running_by_user: Dict[str, int] = {}
+
+        self.queue_wait_ms: Dict[str, Histogram] = {
+            priority: Histogram() for priority in PRIORITY_CLASSES
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        user_no: str,
+        priority: str = INTERACTIVE,
+        cost: float = 1.0,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        """
+        실행 슬롯 획득 후 블록 실행, 종료 시 반납
+
+        Args:
+            user_no: 사용자 식별자
+            priority: 우선순위 클래스 (interactive / batch)
+            cost: 요청 비용 (DRR에서 차감되는 양)
+            timeout: 대기 제한 시간(초). 초과 시 SchedulerTimeoutError
+        """
+        if priority not in self._queues:
+            priority = INTERACTIVE
+        await self._acquire(user_no, priority, cost, timeout)
+        try:
+            yield
+        finally:
+            self._release(user_no, priority)
+
+    async def _acquire(self, user_no: str, priority: str, cost: float, timeout: Optional[float]):
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(user_no=user_no, priority=priority, cost=cost, future=loop.create_future())
+        self._queues[priority].setdefault(user_no, deque()).append(waiter)
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 반납
+                self._release(user_no, priority)
+            else:
+                waiter.future.cancel()
+                self._remove_waiter(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise SchedulerTimeoutError(
+                    f"대기 시간 초과 ({timeout}s) - user: {user_no}, class: {priority}"
+                ) from e
+            raise
+
+    def _release(self, user_no: str, priority: str):
+        self._running -= 1
+        self._running_by_class[priority] -= 1
+        remaining = self._running_by_user.get(user_no, 1) - 1
+        if remaining > 0:
+            self._running_by_user[user_no] = remaining
+        else:
+            self._running_by_user.pop(user_no, None)
+        self._dispatch()
+
+    def _remove_waiter(self, waiter: _Waiter):
+        users = self._queues[waiter.priority]
+        queue = users.get(waiter.user_no)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del users[waiter.user_no]
+            self._deficits[waiter.priority].pop(waiter.user_no, None)
+
+    def _dispatch(self):
+        """빈 슬롯이 있는 동안 다음 대기 요청에 슬롯 할당"""
+        while self._running < self.max_concurrency:
+            priority = self._next_class()
+            if priority is None:
+                return
+            waiter = self._next_waiter(priority)
+            if waiter is None:
+                return
+
+            self._running += 1
+            self._running_by_class[priority] += 1
+            self._running_by_user[waiter.user_no] = self._running_by_user.get(waiter.user_no, 0) + 1
+            self.queue_wait_ms[priority].observe((time.monotonic() - waiter.enqueued_at) * 1000)
+            waiter.future.set_result(None)
+
+    def _user_eligible(self, user_no: str) -> bool:
+        limit = self.anonymous_limit if user_no == ANONYMOUS_USER else self.per_user_limit
+        return self._running_by_user.get(user_no, 0) < limit
+
+    def _class_eligible(self, priority: str) -> bool:
+        if priority == BATCH:
+            batch_limit = max(1, int(self.max_concurrency * self.batch_max_share))
+            if self._running_by_class[BATCH] >= batch_limit:
+                return False
+        return any(self._user_eligible(user_no) for user_no in self._queues[priority])
+
+    def _next_class(self) -> Optional[str]:
+        """대기 요청이 있는 클래스 중 가중치 비율에 따라 선택 (smooth weighted round robin)"""
+        eligible = [priority for priority in PRIORITY_CLASSES if self._class_eligible(priority)]
+        if not eligible:
+            return None
+        total = 0.0
+        for priority in eligible:
+            weight = self.class_weights.get(priority, 1.0)
+            self._class_credits[priority] += weight
+            total += weight
+        selected = max(eligible, key=lambda priority: self._class_credits[priority])
+        self._class_credits[selected] -= total
+        return selected
+
+    def _next_waiter(self, priority: str) -> Optional[_Waiter]:
+        """클래스 내 사용자 대기열을 Deficit Round Robin으로 순회하여 다음 요청 선택"""
+        users = self._queues[priority]
+        deficits = self._deficits[priority]
+        if not any(self._user_eligible(user_no) for user_no in users):
+            return None
+
+        while True:
+            user_no, queue = next(iter(users.items()))
+            if not self._user_eligible(user_no):
+                users.move_to_end(user_no)
+                continue
+
+            waiter = queue[0]
+            deficit = deficits.get(user_no, 0.0)
+            if deficit >= waiter.cost:
+                queue.popleft()
+                deficits[user_no] = deficit - waiter.cost
+                if not queue:
+                    # 대기열이 빈 사용자는 deficit을 이월하지 않음
+                    del users[user_no]
+                    deficits.pop(user_no, None)
+                return waiter
+
+            deficits[user_no] = deficit + self.quantum * self.user_weights.get(user_no, 1.0)
+            users.move_to_end(user_no)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약 (실행/대기 수, 클래스별 대기 시간)"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self._running,
+            "running_by_class": dict(self._running_by_class),
+            "queued_by_class": {
+                priority: sum(len(queue) for queue in users.values())
+                for priority, users in self._queues.items()
+            },
+            "queued_users": {priority: len(users) for priority, users in self._queues.items()},
+            "queue_wait_ms": {
+                priority: histogram.snapshot() for priority, histogram in self.queue_wait_ms.items()
+            },
+        }
+
+    def queue_depth(self) -> int:
+        """전체 대기 요청 수"""
+        return sum(len(queue) for users in self._queues.values() for queue in users.values())
+
+
+def _positive_weights(weights: Dict[str, Any], label: str) -> Dict[str, float]:
+    """0보다 큰 숫자 가중치만 사용 (잘못된 값은 경고 후 무시)"""
+    valid = {}
+    for key, weight in weights.items():
+        if isinstance(weight, (int, float)) and not isinstance(weight, bool) and weight > 0:
+            valid[key] = float(weight)
+        else:
+            logger.warning(f"잘못된 {label} 가중치 무시 (0보다 커야 함) - {key}: {weight}")
+    return valid
+
+
+# 싱글톤 인스턴스
+_scheduler: Optional[FairScheduler] = None
+
+
+def get_scheduler() -> FairScheduler:
+    """스케줄러 인스턴스 가져오기"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = FairScheduler(
+            max_concurrency=int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "32")),
+            per_user_limit=int(os.getenv("SCHEDULER_PER_USER_LIMIT", "4")),
+            anonymous_limit=(
+                int(os.getenv("SCHEDULER_ANONYMOUS_LIMIT")) if os.getenv("SCHEDULER_ANONYMOUS_LIMIT") else None
+            ),
+            batch_max_share=float(os.getenv("SCHEDULER_BATCH_MAX_SHARE", "0.5")),
+            user_weights=json.loads(os.getenv("SCHEDULER_USER_WEIGHTS", "{}")),
+        )
+        logger.info(
+            f"요청 스케줄러 초기화 - 동시 실행: {_scheduler.max_concurrency}, "
+            f"사용자별 제한: {_scheduler.per_user_limit}"
+        )
+    return _scheduler
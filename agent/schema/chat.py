@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 
 class Message(BaseModel):
@@ -8,4 +8,22 @@ class Message(BaseModel):
 
 
 class ChatRequest(BaseModel):
-    messages: List[Message]
\ No newline at end of file
+    messages: List[Message]
+    # 요청 스케줄링 정보 (AgentExecutionState.user_no와 동일한 사용자 식별자)
+    user_no: Optional[str] = None
+    priority: Literal["interactive", "batch"] = "interactive"
+    # structured: StructuredAnswer 형식으로 응답하고 필드 단위로 스트리밍 (data-* 이벤트)
+    response_format: Literal["text", "structured"] = "text"
+
+
+class AnswerSection(BaseModel):
+    """답변 섹션"""
+    title: str = Field(description="섹션 제목")
+    content: str = Field(description="섹션 본문 (마크다운)")
+
+
+class StructuredAnswer(BaseModel):
+    """사용자 질문에 대한 최종 답변. 섹션별 본문으로 구성합니다."""
+    # 참조 문서/이미지 정보는 모델이 생성하지 않음 (검색 결과 없이 만들면 출처가 지어지므로
+    # AgentExecutionState.search_reference_info / image_info 등 검색 단계 결과로만 채움)
+    sections: List[AnswerSection] = Field(description="답변 섹션 목록 (표시 순서대로)")
@@ -40,7 +40,7 @@ class AgentExecutionState(BaseModel):
     # 임베딩 캐시 (기존 코드 재사용)
     embedding_refs: Dict[str, str] = {}
 
-    # 스트리밍 토큰 전송을 위한 큐 (런타임에서 주입)
+    # 스트리밍 토큰 전송을 위한 큐 (런타임에서 주입, agent.buffer.BoundedStreamBuffer 사용)
     streaming_queue: Optional[Any] = None
 
     # 검색 참조 문서 정보
@@ -1,26 +1,96 @@
-from typing import List, AsyncGenerator
+from typing import Any, Dict, List, AsyncGenerator, Optional
 import json
+import os
+import time
 from uuid import uuid4
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from agent.schema.chat import Message
+from agent.schema.chat import Message, StructuredAnswer
 from api.core.logger import APILogger
 from agent.llm_endpoint import get_safe_llm
+from agent.buffer import SlowConsumerError, buffered
+from agent.partial_json import DELTA, IncrementalJSONParser, PartialEvent
+from agent.router import get_model_router, last_user_query
+from agent.tools import get_tool_runtime
+from agent.scheduler import ANONYMOUS_USER, INTERACTIVE, SchedulerTimeoutError, get_scheduler
+from api.core.saturation import get_saturation_monitor
+from api.core.shared_state import get_shared_state
 from config.settings import get_config
 
 logger = APILogger()
 config = get_config()
 
+BUSY_ERROR_MESSAGE = "현재 요청이 많아 처리가 지연되고 있습니다. 잠시 후 다시 시도해 주세요."
 
-async def generate_sse_stream(messages: List[Message]) -> AsyncGenerator[str, None]:
+# 업스트림 호출 속도 제한 (분당 요청 수, 0이면 비활성화). 모든 워커가 하나의 버킷을 공유
+UPSTREAM_RPM_LIMIT = int(os.getenv("UPSTREAM_RPM_LIMIT", "0"))
+UPSTREAM_BUCKET_KEY = "ratelimit:upstream"
+
+# 스케줄러 대기 제한 시간 (초)
+SCHEDULER_QUEUE_TIMEOUT = float(os.getenv("SCHEDULER_QUEUE_TIMEOUT_SECONDS", "60"))
+
+RESPONSE_FORMAT_TEXT = "text"
+RESPONSE_FORMAT_STRUCTURED = "structured"
+
+
+async def generate_sse_stream(
+    messages: List[Message],
+    user_no: Optional[str] = None,
+    priority: str = INTERACTIVE,
+    response_format: str = RESPONSE_FORMAT_TEXT,
+) -> AsyncGenerator[str, None]:
     """
     SSE(Server-Sent Events) 형식으로 스트리밍 응답 생성
 
     Args:
         messages: 채팅 메시지 목록
+        user_no: 사용자 식별자 (스케줄러의 사용자별 공정 분배 기준, 없으면 익명 대기열 하나로 취급)
+        priority: 우선순위 클래스 (interactive / batch)
+        response_format: 응답 형식 (text / structured)
 
     Yields:
         SSE 형식의 문자열 데이터
     """
+    events = generate_chat_events(messages, user_no=user_no, priority=priority, response_format=response_format)
+    # 느린 클라이언트로 인해 버퍼가 무한정 커지지 않도록 크기 제한 버퍼를 거쳐 전송
+    try:
+        async for event in buffered(events, stream_id=f"sse-{uuid4().hex[:12]}"):
+            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+    except SlowConsumerError as e:
+        # 클라이언트가 받지 못하는 상태이므로 에러 이벤트 없이 응답만 종료
+        logger.warning(str(e))
+        return
+
+
+async def generate_chat_events(
+    messages: List[Message],
+    user_no: Optional[str] = None,
+    priority: str = INTERACTIVE,
+    response_format: str = RESPONSE_FORMAT_TEXT,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    채팅 응답 이벤트 생성 (전송 방식과 무관)
+
+    SSE와 WebSocket이 같은 이벤트 어휘(start, text-start, text-delta, text-end, finish, error)를 사용하며,
+    각 전송 계층은 이 이벤트를 자신의 형식으로 직렬화합니다.
+
+    response_format이 structured이면 모델이 StructuredAnswer를 도구 호출 인자(JSON)로 스트리밍하고,
+    증분 파서가 필드 단위 이벤트로 바꿔 전송합니다.
+    - data-field-delta: 작성 중인 문자열 필드의 새 텍스트 (transient)
+    - data-field: 완성된 최상위 배열 항목(sections[0] 등)과 배열이 아닌 최상위 필드
+    - data-answer: 검증을 마친 전체 응답
+
+    Args:
+        messages: 채팅 메시지 목록
+        user_no: 사용자 식별자 (스케줄러의 사용자별 공정 분배 기준, 없으면 익명 대기열 하나로 취급)
+        priority: 우선순위 클래스 (interactive / batch)
+        response_format: 응답 형식 (text / structured)
+
+    Yields:
+        이벤트 dict
+    """
+    shared_state = get_shared_state()
+    saturation_monitor = get_saturation_monitor()
+    saturation_monitor.stream_started()
     try:
         langchain_messages = []
         for msg in messages:
@@ -31,45 +101,144 @@ async def generate_sse_stream(messages: List[Message]) -> AsyncGenerator[str, No
             elif msg.role == "system":
                 langchain_messages.append(SystemMessage(content=msg.content))
 
-        # Azure OpenAI LLM 가져오기
-        llm = get_safe_llm(model_name=config.get("agent-azure-openai-model-name"))
-        logger.info(f"채팅 요청 처리 시작 - 메시지 수: {len(langchain_messages)}")
+        if UPSTREAM_RPM_LIMIT > 0 and not shared_state.try_acquire(
+            UPSTREAM_BUCKET_KEY, rate=UPSTREAM_RPM_LIMIT / 60, capacity=UPSTREAM_RPM_LIMIT
+        ):
+            logger.warning("업스트림 호출 한도 초과 - 요청 거절")
+            error_data = {
+                "type": "error",
+                "errorText": BUSY_ERROR_MESSAGE
+            }
+            yield error_data
+            return
+
+        # 요청 복잡도에 따라 모델 티어 결정 후 Azure OpenAI LLM 가져오기
+        router = get_model_router()
+        route = router.route(messages)
+        llm = get_safe_llm(model_name=route.deployment, deployment=route.deployment)
+        logger.info(
+            f"채팅 요청 처리 시작 - 메시지 수: {len(langchain_messages)}, "
+            f"티어: {route.tier} ({', '.join(route.reasons) or 'simple'})"
+        )
 
         # 스트리밍 응답 생성
         full_response = ""
         message_id = f"assistant-{uuid4()}"
 
         # 메시지 시작 신호 전송
-        yield f"data: {json.dumps({'type': 'start', 'messageId': message_id}, ensure_ascii=False)}\n\n"
-        yield f"data: {json.dumps({'type': 'text-start', 'id': message_id}, ensure_ascii=False)}\n\n"
-
-        async for chunk in llm.astream(langchain_messages):
-            if hasattr(chunk, 'content') and chunk.content:
-                content = chunk.content
-                full_response += content
-
-                # SSE 형식으로 데이터 전송
-                sse_data = {
-                    "type": "text-delta",
-                    "id": message_id,
-                    "delta": content
-                }
-                yield f"data: {json.dumps(sse_data, ensure_ascii=False)}\n\n"
+        yield {'type': 'start', 'messageId': message_id}
+        yield {'type': 'text-start', 'id': message_id}
+
+        first_token_ms = None
+        started = None
+        structured = response_format == RESPONSE_FORMAT_STRUCTURED
+        parser = IncrementalJSONParser() if structured else None
+
+        # 업스트림 동시 실행 슬롯 획득 (사용자별 공정 분배)
+        async with get_scheduler().slot(
+            user_no or ANONYMOUS_USER, priority, timeout=SCHEDULER_QUEUE_TIMEOUT
+        ):
+            # 구조화 응답은 스키마를 유일한 도구로 강제해 인자 JSON을 스트리밍
+            # 그 외에는 등록된 도구가 있으면 도구 호출 루프 포함 스트리밍
+            tool_runtime = get_tool_runtime()
+            if structured:
+                chunks = llm.bind_tools(
+                    [StructuredAnswer], tool_choice=StructuredAnswer.__name__
+                ).astream(langchain_messages)
+            elif tool_runtime.tools:
+                chunks = tool_runtime.astream(llm, langchain_messages)
+            else:
+                chunks = llm.astream(langchain_messages)
+
+            started = time.perf_counter()
+            async for chunk in chunks:
+                if structured:
+                    fragment = "".join(
+                        tool_call_chunk.get("args") or ""
+                        for tool_call_chunk in getattr(chunk, "tool_call_chunks", None) or []
+                    )
+                    if not fragment:
+                        continue
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - started) * 1000
+                    full_response += fragment
+
+                    for partial_event in parser.feed(fragment):
+                        event = _structured_event(message_id, partial_event)
+                        if event is not None:
+                            yield event
+                elif hasattr(chunk, 'content') and chunk.content:
+                    content = chunk.content
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - started) * 1000
+                    full_response += content
+
+                    yield {
+                        "type": "text-delta",
+                        "id": message_id,
+                        "delta": content
+                    }
+
+        if structured:
+            answer = StructuredAnswer.model_validate(parser.close())
+            yield {"type": "data-answer", "id": message_id, "data": answer.model_dump()}
+
+        saturation_monitor.record_upstream(success=True)
+        router.record(
+            route,
+            first_token_ms=first_token_ms,
+            total_ms=(time.perf_counter() - started) * 1000,
+            query=last_user_query(messages),
+            response=full_response,
+        )
 
         # 스트림 완료 신호
-        yield f"data: {json.dumps({'type': 'text-end', 'id': message_id}, ensure_ascii=False)}\n\n"
+        yield {'type': 'text-end', 'id': message_id}
         finish_data = {
             "type": "finish",
             "messageMetadata": {"finishReason": "stop"}
         }
-        yield f"data: {json.dumps(finish_data, ensure_ascii=False)}\n\n"
+        yield finish_data
 
         logger.info(f"채팅 응답 완료 - 응답 길이: {len(full_response)}")
 
+    except SchedulerTimeoutError as e:
+        logger.warning(f"스케줄러 대기 시간 초과: {e}")
+        error_data = {
+            "type": "error",
+            "errorText": BUSY_ERROR_MESSAGE
+        }
+        yield error_data
     except Exception as e:
         logger.error(f"스트리밍 중 에러 발생: {e}")
+        saturation_monitor.record_upstream(success=False)
         error_data = {
             "type": "error",
             "errorText": str(e)
         }
-        yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
\ No newline at end of file
+        yield error_data
+    finally:
+        saturation_monitor.stream_finished()
+
+
+def _structured_event(message_id: str, partial_event: PartialEvent) -> Optional[Dict[str, Any]]:
+    """
+    증분 파서 이벤트를 data-* 이벤트로 변환
+
+    경로별 id가 같으므로 UI는 같은 필드의 data-field를 덮어써서 갱신할 수 있습니다.
+    최상위 배열 자체는 항목을 이미 하나씩 보냈으므로 다시 보내지 않고, 최종 상태는 data-answer로 전달합니다.
+    """
+    path = list(partial_event.path)
+    event_id = f"{message_id}:{'.'.join(str(key) for key in path)}"
+    if partial_event.kind == DELTA:
+        return {
+            "type": "data-field-delta",
+            "id": event_id,
+            "data": {"path": path, "delta": partial_event.value},
+            "transient": True,
+        }
+    is_array_item = len(path) == 2 and isinstance(path[1], int)
+    is_scalar_field = len(path) == 1 and not isinstance(partial_event.value, list)
+    if is_array_item or is_scalar_field:
+        return {"type": "data-field", "id": event_id, "data": {"path": path, "value": partial_event.value}}
+    return None
@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from langchain_core.messages import AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.tools import BaseTool, StructuredTool, Tool
+from api.core.logger import APILogger
+from api.core.shared_state import get_shared_state
+
+logger = APILogger()
+
+
+@dataclass
+class ToolOptions:
+    """
+    도구별 실행 옵션
+
+    Attributes:
+        timeout: 실행 제한 시간(초). 시간 초과 시 모델에는 바로 에러를 전달하지만,
+            스레드 풀에서 실행 중인 동기 도구는 중단할 수 없어 끝날 때까지 워커 스레드를 점유함
+        idempotent: True면 (도구, 인자) 기준으로 결과를 cache_ttl 동안 재사용
+        cpu_bound: True면 동기 도구를 프로세스 풀에서 실행 (도구 객체가 pickle 가능해야 함)
+        cache_ttl: 결과 캐시 TTL(초)
+    """
+    timeout: float = 30.0
+    idempotent: bool = False
+    cpu_bound: bool = False
+    cache_ttl: float = 300.0
+
+
+def _is_async_tool(tool: BaseTool) -> bool:
+    """네이티브 async 구현이 있는 도구인지 확인 (없으면 ainvoke가 기본 executor로 위임됨)"""
+    # @tool / Tool.from_function 도구는 _arun을 항상 재정의하므로 coroutine 유무로만 판단
+    if isinstance(tool, (StructuredTool, Tool)):
+        return tool.coroutine is not None
+    return type(tool)._arun is not BaseTool._arun
+
+
+def _invoke_tool(tool: BaseTool, args: Dict[str, Any]) -> Any:
+    """스레드/프로세스 풀에서 실행되는 동기 도구 호출"""
+    return tool.invoke(args)
+
+
+class ToolRuntime:
+    """
+    도구 실행 엔진 (bind_tools 결과의 tool_calls 실행)
+
+    - 한 턴에서 모델이 요청한 도구 호출을 모두 동시에 실행
+    - async 도구는 이벤트 루프에서, 동기 도구는 스레드 풀, CPU 작업은 프로세스 풀에서 실행
+    - 도구별 제한 시간, 실패/시간 초과는 에러 ToolMessage로 모델에 전달
+    - idempotent 도구는 (도구, 인자) 기준으로 결과를 공유 캐시에 TTL 동안 저장 (워커 간 공유)
+    """
+
+    def __init__(self, thread_workers: int = 8, process_workers: int = 0):
+        self._tools: Dict[str, BaseTool] = {}
+        self._options: Dict[str, ToolOptions] = {}
+        self._thread_pool = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix="tool")
+        self._process_pool = (
+            ProcessPoolExecutor(max_workers=process_workers) if process_workers > 0 else None
+        )
+
+    @property
+    def tools(self) -> List[BaseTool]:
+        return list(self._tools.values())
+
+    def register(self, tool: BaseTool, options: Optional[ToolOptions] = None) -> None:
+        """도구 등록"""
+        self._tools[tool.name] = tool
+        self._options[tool.name] = options or ToolOptions()
+        logger.info(f"도구 등록: {tool.name}")
+
+    async def execute(self, tool_calls: List[Dict[str, Any]]) -> List[ToolMessage]:
+        """
+        도구 호출 일괄 실행 (동시 실행, 입력 순서대로 결과 반환)
+
+        Args:
+            tool_calls: AIMessage.tool_calls
+
+        Returns:
+            List[ToolMessage]: 다음 모델 호출에 전달할 도구 결과
+        """
+        return list(await asyncio.gather(*(self._run_one(call) for call in tool_calls)))
+
+    async def _run_one(self, tool_call: Dict[str, Any]) -> ToolMessage:
+        name = tool_call["name"]
+        args = tool_call.get("args", {})
+        call_id = tool_call.get("id")
+
+        tool = self._tools.get(name)
+        if tool is None:
+            return ToolMessage(
+                content=f"알 수 없는 도구입니다: {name}", tool_call_id=call_id, name=name, status="error"
+            )
+        options = self._options[name]
+
+        cache_key = None
+        if options.idempotent:
+            args_digest = hashlib.sha256(
+                json.dumps(args, sort_keys=True, ensure_ascii=False, default=str).encode()
+            ).hexdigest()
+            cache_key = f"tool:{name}:{args_digest}"
+            cached = get_shared_state().cache_get(cache_key)
+            if cached is not None:
+                return ToolMessage(content=cached, tool_call_id=call_id, name=name)
+
+        try:
+            result = await asyncio.wait_for(self._invoke(tool, args, options), options.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"도구 실행 시간 초과 ({options.timeout}s, 동기 도구는 백그라운드에서 계속 실행): {name}")
+            return ToolMessage(
+                content=f"도구 실행 시간이 초과되었습니다: {name}",
+                tool_call_id=call_id,
+                name=name,
+                status="error",
+            )
+        except Exception as e:
+            logger.error(f"도구 실행 에러 - {name}: {e}")
+            return ToolMessage(
+                content=f"도구 실행 중 오류가 발생했습니다: {e}",
+                tool_call_id=call_id,
+                name=name,
+                status="error",
+            )
+
+        content = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False, default=str)
+        if cache_key is not None:
+            get_shared_state().cache_set(cache_key, content, options.cache_ttl)
+        return ToolMessage(content=content, tool_call_id=call_id, name=name)
+
+    async def _invoke(self, tool: BaseTool, args: Dict[str, Any], options: ToolOptions) -> Any:
+        if _is_async_tool(tool):
+            return await tool.ainvoke(args)
+        loop = asyncio.get_running_loop()
+        if options.cpu_bound and self._process_pool is not None:
+            return await loop.run_in_executor(self._process_pool, _invoke_tool, tool, args)
+        return await loop.run_in_executor(self._thread_pool, _invoke_tool, tool, args)
+
+    async def astream(
+        self, llm, messages: List[BaseMessage], max_rounds: int = 5
+    ) -> AsyncGenerator[AIMessageChunk, None]:
+        """
+        도구 호출 루프를 포함한 스트리밍
+
+        각 턴의 텍스트 청크는 바로 전달하고, 턴이 끝나면 요청된 도구 호출을 일괄 실행한 뒤
+        결과를 붙여 다음 모델 호출을 바로 이어서 스트리밍합니다.
+
+        Args:
+            llm: SafeLLMWrapper (bind_tools 지원)
+            messages: 대화 메시지
+            max_rounds: 최대 도구 호출 턴 수
+        """
+        bound = llm.bind_tools(self.tools)
+        history = list(messages)
+
+        for round_index in range(max_rounds + 1):
+            gathered: Optional[AIMessageChunk] = None
+            async for chunk in bound.astream(history):
+                gathered = chunk if gathered is None else gathered + chunk
+                yield chunk
+
+            if gathered is None or not gathered.tool_calls:
+                return
+            if round_index == max_rounds:
+                logger.warning(f"도구 호출 최대 턴 수 도달: {max_rounds}")
+                return
+
+            tool_names = ", ".join(call["name"] for call in gathered.tool_calls)
+            logger.info(f"도구 호출 {len(gathered.tool_calls)}건 실행: {tool_names}")
+            history.append(gathered)
+            history.extend(await self.execute(gathered.tool_calls))
+
+
+# 싱글톤 인스턴스
+_tool_runtime: Optional[ToolRuntime] = None
+
+
+def get_tool_runtime() -> ToolRuntime:
+    """도구 실행 엔진 인스턴스 가져오기"""
+    global _tool_runtime
+    if _tool_runtime is None:
+        _tool_runtime = ToolRuntime(
+            thread_workers=int(os.getenv("TOOL_THREAD_WORKERS", "8")),
+            process_workers=int(os.getenv("TOOL_PROCESS_WORKERS", "0")),
+        )
+    return _tool_runtime
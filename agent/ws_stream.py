@@ -0,0 +1,201 @@
+"""
+WebSocket 채팅 전송 (하나의 연결에서 여러 대화 스트림 다중화)
+
+프레임은 JSON 배열을 UTF-8로 인코딩한 바이너리 메시지입니다.
+
+client → server: [op, stream_id, payload]
+    0 OPEN    payload: ChatRequest 필드 + "window"(초기 credit, 선택)
+    1 CANCEL  payload: null
+    2 CREDIT  payload: 추가로 받을 수 있는 이벤트 수
+
+server → client: [event_code, stream_id, payload]
+    SSE와 같은 이벤트 어휘를 코드로 압축 (EVENT_CODES 참고).
+    payload는 이벤트 dict에서 type을 뺀 나머지이며, text-delta는 delta 문자열만 전송합니다.
+    (text-delta의 id는 같은 스트림의 text-start에서 알 수 있으므로 생략)
+    구조화 응답(response_format=structured)의 data-* 이벤트도 같은 방식으로 전달합니다.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
+from fastapi import WebSocket
+from pydantic import ValidationError
+from agent.buffer import SlowConsumerError, buffered
+from agent.schema.chat import ChatRequest
+from agent.stream import generate_chat_events
+from api.core.logger import APILogger
+
+logger = APILogger()
+
+OP_OPEN = 0
+OP_CANCEL = 1
+OP_CREDIT = 2
+
+EVENT_CODES = {
+    "start": 0,
+    "text-start": 1,
+    "text-delta": 2,
+    "text-end": 3,
+    "finish": 4,
+    "error": 5,
+    "abort": 6,
+    "data-field-delta": 7,
+    "data-field": 8,
+    "data-answer": 9,
+}
+
+DEFAULT_WINDOW = int(os.getenv("WS_STREAM_WINDOW", "64"))
+MAX_STREAMS_PER_CONNECTION = int(os.getenv("WS_MAX_STREAMS_PER_CONNECTION", "8"))
+
+
+def encode_frame(event: Dict[str, Any], stream_id: Optional[int]) -> bytes:
+    """이벤트를 바이너리 프레임으로 인코딩"""
+    event_type = event["type"]
+    if event_type == "text-delta":
+        payload = event["delta"]
+    else:
+        payload = {key: value for key, value in event.items() if key != "type"} or None
+    frame = [EVENT_CODES[event_type], stream_id, payload]
+    return json.dumps(frame, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class StreamFlow:
+    """
+    스트림별 흐름 제어 (credit 기반)
+
+    클라이언트가 허용한 수만큼만 이벤트를 보내고, credit이 없으면 CREDIT 프레임을 기다립니다.
+    느린 대화 하나가 같은 연결의 다른 대화를 막지 않도록 스트림 단위로 동작합니다.
+    """
+
+    def __init__(self, window: int):
+        self.credit = window
+        self._available = asyncio.Event()
+
+    def grant(self, amount: int) -> None:
+        self.credit += amount
+        if self.credit > 0:
+            self._available.set()
+
+    async def consume(self) -> None:
+        while self.credit <= 0:
+            self._available.clear()
+            await self._available.wait()
+        self.credit -= 1
+
+
+class ChatConnection:
+    """WebSocket 연결 하나에서 여러 채팅 스트림을 동시에 처리"""
+
+    def __init__(self, websocket: WebSocket, max_streams: int = MAX_STREAMS_PER_CONNECTION):
+        self.websocket = websocket
+        self.max_streams = max_streams
+        self._streams: Dict[int, asyncio.Task] = {}
+        self._flows: Dict[int, StreamFlow] = {}
+        self._send_lock = asyncio.Lock()
+        self._closed = False
+
+    async def run(self) -> None:
+        """연결이 끊길 때까지 클라이언트 프레임 처리"""
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                raw = message.get("bytes") or message.get("text")
+                try:
+                    frame = json.loads(raw)
+                except (TypeError, ValueError):
+                    frame = None
+                # 프레임은 [op, stream_id, payload] 배열만 허용 (키가 3개인 객체 등은 언패킹되지 않도록)
+                if not isinstance(frame, list) or len(frame) != 3:
+                    await self._send_error(None, "잘못된 프레임 형식입니다.")
+                    continue
+                op, stream_id, payload = frame
+                # stream_id는 dict 키로 쓰이므로 조회 전에 검사 (bool은 int 하위 타입이므로 제외)
+                if not isinstance(stream_id, int) or isinstance(stream_id, bool):
+                    await self._send_error(None, "사용할 수 없는 stream_id입니다.")
+                    continue
+
+                if op == OP_OPEN:
+                    await self._open(stream_id, payload if isinstance(payload, dict) else {})
+                elif op == OP_CANCEL:
+                    task = self._streams.get(stream_id)
+                    if task is not None:
+                        task.cancel()
+                elif op == OP_CREDIT:
+                    flow = self._flows.get(stream_id)
+                    if flow is not None and isinstance(payload, int) and payload > 0:
+                        flow.grant(payload)
+                else:
+                    await self._send_error(stream_id, f"알 수 없는 op: {op}")
+        finally:
+            self._closed = True
+            tasks = list(self._streams.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _open(self, stream_id: int, payload: Dict[str, Any]) -> None:
+        if stream_id in self._streams:
+            await self._send_error(stream_id, "사용할 수 없는 stream_id입니다.")
+            return
+        if len(self._streams) >= self.max_streams:
+            await self._send_error(stream_id, "동시에 진행할 수 있는 대화 수를 초과했습니다.")
+            return
+        try:
+            request = ChatRequest.model_validate(payload)
+        except ValidationError as e:
+            await self._send_error(stream_id, f"잘못된 요청입니다: {e.errors()}")
+            return
+
+        window = payload.get("window", DEFAULT_WINDOW)
+        flow = StreamFlow(window if isinstance(window, int) and window > 0 else DEFAULT_WINDOW)
+        self._flows[stream_id] = flow
+        self._streams[stream_id] = asyncio.create_task(
+            self._run_stream(stream_id, request, flow), name=f"ws-stream-{stream_id}"
+        )
+
+    async def _run_stream(self, stream_id: int, request: ChatRequest, flow: StreamFlow) -> None:
+        events = buffered(
+            generate_chat_events(
+                request.messages,
+                user_no=request.user_no,
+                priority=request.priority,
+                response_format=request.response_format,
+            ),
+            stream_id=f"ws-{id(self):x}-{stream_id}",
+        )
+        try:
+            async for event in events:
+                await flow.consume()
+                await self._send(encode_frame(event, stream_id))
+        except asyncio.CancelledError:
+            # 클라이언트 CANCEL (연결 종료로 인한 취소는 응답 불필요)
+            if not self._closed:
+                logger.info(f"WebSocket 스트림 취소 - stream_id: {stream_id}")
+                await self._send(encode_frame({"type": "abort"}, stream_id))
+        except SlowConsumerError as e:
+            logger.warning(str(e))
+            await self._send_error(stream_id, "응답 수신이 지연되어 스트림을 종료했습니다.")
+        except Exception as e:
+            logger.error(f"WebSocket 스트림 에러 - stream_id: {stream_id}: {e}")
+            await self._send_error(stream_id, str(e))
+        finally:
+            # credit 대기 중 취소된 경우에도 업스트림 정리 (스케줄러 슬롯, 진행 중 카운터, 버퍼 예산 반납)
+            await events.aclose()
+            self._streams.pop(stream_id, None)
+            self._flows.pop(stream_id, None)
+
+    async def _send_error(self, stream_id: Optional[int], error_text: str) -> None:
+        await self._send(encode_frame({"type": "error", "errorText": error_text}, stream_id))
+
+    async def _send(self, frame: bytes) -> None:
+        if self._closed:
+            return
+        async with self._send_lock:
+            try:
+                await self.websocket.send_bytes(frame)
+            except Exception as e:
+                # 연결이 이미 끊긴 경우: 이후 전송 중단 (receive 루프에서 정리)
+                logger.debug(f"WebSocket 전송 실패: {e}")
+                self._closed = True
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from api.core.logger import APILogger
+from api.core.metrics import Histogram
+
+logger = APILogger()
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 모니터
+
+    - 샘플러 태스크: interval마다 sleep 후 실제 경과 시간과의 차이(지연)를 히스토그램에 기록
+    - 워치독 스레드: 샘플러의 heartbeat가 stall_threshold 이상 멈추면
+      루프 스레드의 현재 스택을 캡처 (어떤 블로킹 호출이 루프를 점유했는지 확인용)
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        stall_threshold: float = 0.25,
+        max_stalls: int = 20,
+    ):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.lag_ms = Histogram()
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self.current_lag_ms: float = 0.0
+        # 최근 지연 추세 (지수 이동 평균) - 순간값보다 안정적인 포화도 판단용
+        self.avg_lag_ms: float = 0.0
+
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 모니터 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._sample_loop(), name="loop-lag-sampler"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            f"이벤트 루프 지연 모니터 시작 - interval: {self.interval}s, "
+            f"stall 임계값: {self.stall_threshold}s"
+        )
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample_loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, (now - started - self.interval) * 1000)
+            self.current_lag_ms = lag
+            self.avg_lag_ms = self.avg_lag_ms * 0.8 + lag * 0.2
+            self.lag_ms.observe(lag)
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        captured_beat = None
+        while not self._stopped.wait(self.interval):
+            beat = self._last_beat
+            blocked = time.monotonic() - beat
+            # 같은 stall은 한 번만 캡처
+            if blocked < self.stall_threshold or beat == captured_beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            captured_beat = beat
+            stack = traceback.format_stack(frame)
+            self.stalls.append(
+                {
+                    "captured_at": time.time(),
+                    "blocked_ms": round(blocked * 1000, 1),
+                    "stack": stack,
+                }
+            )
+            # 마지막 프레임(블로킹 지점)만 로그로 남김
+            logger.warning(
+                f"이벤트 루프 블로킹 감지 ({blocked * 1000:.0f}ms 이상): "
+                f"{stack[-1].strip() if stack else '(unknown)'}"
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약"""
+        return {
+            "current_lag_ms": round(self.current_lag_ms, 3),
+            "avg_lag_ms": round(self.avg_lag_ms, 3),
+            "lag_ms": self.lag_ms.snapshot(),
+            "stalls": list(self.stalls),
+        }
+
+
+# 싱글톤 인스턴스
+_loop_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """이벤트 루프 지연 모니터 인스턴스 가져오기"""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopLagMonitor(
+            interval=float(os.getenv("LOOP_MONITOR_INTERVAL_SECONDS", "0.1")),
+            stall_threshold=float(os.getenv("LOOP_STALL_THRESHOLD_SECONDS", "0.25")),
+        )
+    return _loop_monitor
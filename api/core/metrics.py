@@ -0,0 +1,68 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, Sequence
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (지연 시간 등 ms 단위 값 기록용)
+
+    백분위수는 해당 값이 속한 버킷의 상한으로 근사합니다.
+    """
+
+    DEFAULT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float) -> None:
+        """값 기록"""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, q: float) -> float:
+        """
+        백분위수 근사값
+
+        Args:
+            q: 0~1 사이 백분위 (예: 0.99)
+        """
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            target = q * self.count
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= target:
+                    return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """조회용 요약 (count, avg, max, p50/p90/p99, 버킷별 개수)"""
+        p50, p90, p99 = self.percentile(0.5), self.percentile(0.9), self.percentile(0.99)
+        with self._lock:
+            labels = [f"<={bound:g}" for bound in self.buckets] + ["+Inf"]
+            return {
+                "count": self.count,
+                "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+                "max": round(self.max, 3),
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "buckets": dict(zip(labels, self._counts)),
+            }
@@ -0,0 +1,121 @@
+import asyncio
+import cProfile
+import os
+import random
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, Mapping, Optional
+from api.core.logger import APILogger
+
+logger = APILogger()
+
+# 요청 단위 프로파일링을 요청하는 헤더 (관리자 설정에서 header_trigger가 켜져 있을 때만 동작)
+PROFILE_HEADER = "x-profile-request"
+
+
+class RequestProfiler:
+    """
+    요청 단위 샘플링 프로파일러 (opt-in)
+
+    헤더 또는 sample_rate로 선택된 요청의 스트리밍 구간 전체를 cProfile로 기록하고,
+    slow_threshold_ms 이상 걸린 경우에만 .prof 파일로 저장합니다.
+
+    cProfile은 프로세스당 하나만 활성화할 수 있고 같은 루프의 다른 태스크도 함께
+    기록되므로, 동시에 하나의 요청만 프로파일링합니다.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+        self.sample_rate = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+        self.header_trigger = True
+        self.slow_threshold_ms = float(os.getenv("PROFILER_SLOW_THRESHOLD_MS", "3000"))
+        self.output_dir = os.getenv("PROFILER_OUTPUT_DIR", "logs/profiles")
+        self.artifacts: Deque[Dict[str, Any]] = deque(maxlen=50)
+        self._active = False
+
+    def update(self, **settings) -> None:
+        """관리자 API에서 설정 변경"""
+        for key, value in settings.items():
+            if value is not None and hasattr(self, key):
+                setattr(self, key, value)
+        logger.info(f"프로파일러 설정 변경: {self.settings()}")
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "header_trigger": self.header_trigger,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "output_dir": self.output_dir,
+        }
+
+    def should_profile(self, headers: Mapping[str, str]) -> bool:
+        """요청의 프로파일링 여부 결정"""
+        if not self.enabled or self._active:
+            return False
+        if self.header_trigger and headers.get(PROFILE_HEADER, "").lower() in ("1", "true"):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def profile_stream(
+        self, stream: AsyncGenerator[str, None], label: str
+    ) -> AsyncGenerator[str, None]:
+        """
+        스트리밍 제너레이터를 프로파일링하며 그대로 전달
+
+        Args:
+            stream: 원본 스트림
+            label: 결과 파일명에 사용할 요청 식별자
+        """
+        if self._active:
+            async for item in stream:
+                yield item
+            return
+
+        self._active = True
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 활성화된 경우
+            self._active = False
+            async for item in stream:
+                yield item
+            return
+
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            profile.disable()
+            self._active = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.slow_threshold_ms:
+                await self._dump(profile, label, elapsed_ms)
+
+    async def _dump(self, profile: cProfile.Profile, label: str, elapsed_ms: float) -> None:
+        path = os.path.join(self.output_dir, f"{int(time.time())}-{label}.prof")
+        try:
+            # 파일 쓰기는 루프를 막지 않도록 스레드에서 수행
+            await asyncio.to_thread(os.makedirs, self.output_dir, exist_ok=True)
+            await asyncio.to_thread(profile.dump_stats, path)
+        except Exception as e:
+            logger.error(f"프로파일 저장 실패: {e}")
+            return
+        self.artifacts.append(
+            {"path": path, "elapsed_ms": round(elapsed_ms, 1), "created_at": time.time()}
+        )
+        logger.info(f"느린 요청 프로파일 저장 ({elapsed_ms:.0f}ms): {path}")
+
+
+# 싱글톤 인스턴스
+_profiler: Optional[RequestProfiler] = None
+
+
+def get_profiler() -> RequestProfiler:
+    """요청 프로파일러 인스턴스 가져오기"""
+    global _profiler
+    if _profiler is None:
+        _profiler = RequestProfiler()
+    return _profiler
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from agent.scheduler import get_scheduler
+from api.core.logger import APILogger
+from api.core.loop_monitor import get_loop_monitor
+from api.core.shared_state import get_shared_state
+
+logger = APILogger()
+
+# 공유 상태에 워커별 지표를 보고하는 그룹명
+SATURATION_REPORT_GROUP = "saturation"
+
+
+class SaturationMonitor:
+    """
+    서버 포화도 판단 (readiness / 부하 점수)
+
+    아래 지표를 각 임계값으로 나눈 비율 중 최댓값을 부하 점수로 사용합니다.
+    - 진행 중인 스트림 수 (파드 전체 합계)
+    - 스케줄러 대기열 길이 (가장 큰 워커 기준)
+    - 이벤트 루프 지연 (이동 평균, 가장 큰 워커 기준)
+    - 업스트림(Azure OpenAI) 에러율 (최근 window 초, 가장 큰 워커 기준)
+
+    각 워커는 자신의 지표를 report_interval마다 공유 상태에 보고하면서 다른 워커들의 최근 보고값을 받아 두고,
+    판단 시에는 자신의 현재 값과 받아 둔 값을 합칩니다. 따라서 어느 워커가 응답하든 같은 파드 단위 결과를 주며,
+    응답마다 IPC가 발생하지 않습니다. 비정상 종료된 워커의 보고값은 report_ttl이 지나면 제외됩니다.
+
+    부하 점수가 1 이상이면 not ready로 판단하여 로드밸런서가 새 요청을 다른 파드로 보내도록 합니다.
+    """
+
+    def __init__(
+        self,
+        max_inflight_streams: int = 200,
+        max_queue_depth: int = 50,
+        max_loop_lag_ms: float = 500.0,
+        max_upstream_error_rate: float = 0.5,
+        error_window: float = 60.0,
+        min_error_samples: int = 10,
+        report_interval: float = 1.0,
+        report_ttl: float = 5.0,
+    ):
+        self.max_inflight_streams = max_inflight_streams
+        self.max_queue_depth = max_queue_depth
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.max_upstream_error_rate = max_upstream_error_rate
+        self.error_window = error_window
+        self.min_error_samples = min_error_samples
+        self.report_interval = report_interval
+        self.report_ttl = report_ttl
+
+        self._lock = threading.Lock()
+        self._upstream_results: Deque[Tuple[float, bool]] = deque()
+        self.inflight_streams = 0
+
+        self._member = str(os.getpid())
+        self._peers: Dict[str, Dict[str, float]] = {}  # 다른 워커들의 최근 보고값
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 지표 보고 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._member = str(os.getpid())
+        self._task = asyncio.get_running_loop().create_task(
+            self._report_loop(), name="saturation-reporter"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await asyncio.to_thread(get_shared_state().withdraw, SATURATION_REPORT_GROUP, self._member)
+        except Exception as e:
+            logger.warning(f"포화도 지표 보고 해제 실패: {e}")
+        self._peers = {}
+
+    async def _report_loop(self) -> None:
+        shared_state = get_shared_state()
+        while True:
+            try:
+                # 공유 상태 서버 호출은 블로킹 소켓 통신이므로 스레드에서 실행
+                reports = await asyncio.to_thread(
+                    shared_state.report,
+                    SATURATION_REPORT_GROUP,
+                    self._member,
+                    self._local_metrics(),
+                    self.report_ttl,
+                )
+                self._peers = {member: value for member, value in reports.items() if member != self._member}
+            except Exception as e:
+                # 공유 상태를 쓸 수 없으면 이 워커의 지표만으로 판단
+                logger.warning(f"포화도 지표 보고 실패: {e}")
+                self._peers = {}
+            await asyncio.sleep(self.report_interval)
+
+    def stream_started(self) -> None:
+        self.inflight_streams += 1
+
+    def stream_finished(self) -> None:
+        self.inflight_streams = max(0, self.inflight_streams - 1)
+
+    def record_upstream(self, success: bool) -> None:
+        """업스트림 호출 결과 기록"""
+        now = time.monotonic()
+        with self._lock:
+            self._upstream_results.append((now, success))
+            self._trim(now)
+
+    def upstream_error_rate(self) -> float:
+        """최근 window 내 업스트림 에러율 (표본이 적으면 0)"""
+        with self._lock:
+            self._trim(time.monotonic())
+            total = len(self._upstream_results)
+            if total < self.min_error_samples:
+                return 0.0
+            failures = sum(1 for _, success in self._upstream_results if not success)
+            return failures / total
+
+    def _trim(self, now: float) -> None:
+        while self._upstream_results and self._upstream_results[0][0] < now - self.error_window:
+            self._upstream_results.popleft()
+
+    def load_score(self) -> float:
+        """부하 점수 (1 이상이면 포화)"""
+        return self.evaluate()["load_score"]
+
+    def _local_metrics(self) -> Dict[str, float]:
+        """이 워커의 현재 지표"""
+        return {
+            "inflight_streams": self.inflight_streams,
+            "queue_depth": get_scheduler().queue_depth(),
+            "loop_lag_ms": round(get_loop_monitor().avg_lag_ms, 3),
+            "upstream_error_rate": round(self.upstream_error_rate(), 3),
+        }
+
+    def evaluate(self) -> Dict[str, Any]:
+        """지표별 파드 단위 현재 값/임계값과 readiness 판단 결과"""
+        workers = [self._local_metrics(), *self._peers.values()]
+        metrics = {
+            "inflight_streams": (
+                sum(worker["inflight_streams"] for worker in workers),
+                self.max_inflight_streams,
+            ),
+            "queue_depth": (max(worker["queue_depth"] for worker in workers), self.max_queue_depth),
+            "loop_lag_ms": (max(worker["loop_lag_ms"] for worker in workers), self.max_loop_lag_ms),
+            "upstream_error_rate": (
+                max(worker["upstream_error_rate"] for worker in workers),
+                self.max_upstream_error_rate,
+            ),
+        }
+        checks = {
+            name: {"value": value, "threshold": threshold, "ok": value < threshold}
+            for name, (value, threshold) in metrics.items()
+        }
+        load_score = max(
+            (value / threshold if threshold > 0 else 0.0) for value, threshold in metrics.values()
+        )
+        return {
+            "ready": all(check["ok"] for check in checks.values()),
+            "load_score": round(load_score, 3),
+            "workers": len(workers),
+            "checks": checks,
+        }
+
+
+# 싱글톤 인스턴스
+_saturation_monitor: Optional[SaturationMonitor] = None
+
+
+def get_saturation_monitor() -> SaturationMonitor:
+    """포화도 모니터 인스턴스 가져오기"""
+    global _saturation_monitor
+    if _saturation_monitor is None:
+        _saturation_monitor = SaturationMonitor(
+            max_inflight_streams=int(os.getenv("READY_MAX_INFLIGHT_STREAMS", "200")),
+            max_queue_depth=int(os.getenv("READY_MAX_QUEUE_DEPTH", "50")),
+            max_loop_lag_ms=float(os.getenv("READY_MAX_LOOP_LAG_MS", "500")),
+            max_upstream_error_rate=float(os.getenv("READY_MAX_UPSTREAM_ERROR_RATE", "0.5")),
+            report_interval=float(os.getenv("SATURATION_REPORT_INTERVAL_SECONDS", "1")),
+        )
+    return _saturation_monitor
@@ -0,0 +1,196 @@
+import os
+import secrets
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, Optional, Tuple
+from api.core.logger import APILogger
+
+logger = APILogger()
+
+# 멀티 워커 모드에서 런처가 워커에게 전달하는 공유 상태 서버 접속 정보
+SHARED_STATE_ADDRESS_ENV = "QUICK_AGENT_SHARED_STATE_ADDRESS"
+SHARED_STATE_AUTHKEY_ENV = "QUICK_AGENT_SHARED_STATE_AUTHKEY"
+
+
+class SharedState:
+    """
+    워커 간 공유 상태 저장소
+
+    - 워커 보고값: 워커별로 주기적으로 갱신하고 전체를 모아 보는 값 (report / withdraw),
+      ttl 안에 갱신하지 않은 워커(비정상 종료 등)의 값은 자동으로 제외
+    - 토큰 버킷: 업스트림(Azure OpenAI) 호출 속도 제한 (try_acquire)
+    - 캐시 인덱스: TTL 기반 키/값 (cache_get / cache_set), 최대 max_cache_entries개까지 LRU로 유지
+
+    단일 프로세스 모드에서는 프로세스 내 객체로 직접 사용하고,
+    멀티 워커 모드에서는 런처가 띄운 Manager 서버 프로세스에서 호스팅되어
+    워커들이 로컬 소켓을 통해 같은 인스턴스에 접근합니다.
+    """
+
+    def __init__(self, max_cache_entries: int = 10000):
+        # Manager 서버는 연결마다 스레드를 사용하므로 lock 필요
+        self._lock = threading.Lock()
+        self._reports: Dict[str, Dict[str, Tuple[Any, float]]] = {}  # group -> member -> (값, 만료 시각)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (남은 토큰, 마지막 충전 시각)
+        # key -> (값, 만료 시각), 순서 = 최근 사용 순 (앞쪽이 가장 오래됨)
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.max_cache_entries = max_cache_entries
+
+    def report(self, group: str, member: str, value: Any, ttl: float) -> Dict[str, Any]:
+        """
+        워커 보고값 갱신 후 그룹 내 유효한 보고값 전체 반환
+
+        Args:
+            group: 보고값 종류
+            member: 보고하는 워커 식별자
+            value: 보고값
+            ttl: 유효 시간 (이 시간 안에 다시 보고하지 않으면 제외)
+
+        Returns:
+            Dict[str, Any]: member -> 보고값 (만료된 member는 정리 후 제외)
+        """
+        now = time.monotonic()
+        with self._lock:
+            members = self._reports.setdefault(group, {})
+            members[member] = (value, now + ttl)
+            for key in [key for key, (_, expires_at) in members.items() if expires_at < now]:
+                del members[key]
+            return {key: value for key, (value, _) in members.items()}
+
+    def withdraw(self, group: str, member: str) -> None:
+        """워커 보고값 삭제 (정상 종료 시)"""
+        with self._lock:
+            self._reports.get(group, {}).pop(member, None)
+
+    def try_acquire(self, key: str, rate: float, capacity: float, tokens: float = 1.0) -> bool:
+        """
+        토큰 버킷에서 토큰 획득 시도
+
+        Args:
+            key: 버킷 키
+            rate: 초당 충전 토큰 수
+            capacity: 버킷 최대 용량
+            tokens: 소비할 토큰 수
+
+        Returns:
+            bool: 획득 성공 여부
+        """
+        now = time.monotonic()
+        with self._lock:
+            available, last = self._buckets.get(key, (capacity, now))
+            available = min(capacity, available + (now - last) * rate)
+            if available >= tokens:
+                self._buckets[key] = (available - tokens, now)
+                return True
+            self._buckets[key] = (available, now)
+            return False
+
+    def cache_get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료 시 None)"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def cache_set(self, key: str, value: Any, ttl: float) -> None:
+        """캐시 저장 (가득 차면 만료된 항목, 그다음 가장 오래 사용하지 않은 항목부터 제거)"""
+        now = time.monotonic()
+        with self._lock:
+            self._cache[key] = (value, now + ttl)
+            self._cache.move_to_end(key)
+            # 앞쪽(오래된 항목)부터 만료된 항목 정리
+            while self._cache:
+                oldest_key, (_, expires_at) = next(iter(self._cache.items()))
+                if expires_at >= now or oldest_key == key:
+                    break
+                del self._cache[oldest_key]
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+
+    def cache_delete(self, key: str) -> None:
+        """캐시 삭제"""
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+def _create_state() -> SharedState:
+    return SharedState(max_cache_entries=int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "10000")))
+
+
+# Manager 서버 프로세스에서 호스팅되는 인스턴스
+_server_state: Optional[SharedState] = None
+
+
+def _get_server_state() -> SharedState:
+    global _server_state
+    if _server_state is None:
+        _server_state = _create_state()
+    return _server_state
+
+
+class _SharedStateServer(BaseManager):
+    """런처(마스터 프로세스)에서 띄우는 공유 상태 서버"""
+
+
+class _SharedStateClient(BaseManager):
+    """워커에서 공유 상태 서버에 접속하는 클라이언트"""
+
+
+_SharedStateServer.register("get_state", callable=_get_server_state)
+_SharedStateClient.register("get_state")
+
+
+def start_shared_state_server() -> _SharedStateServer:
+    """
+    공유 상태 서버 프로세스 시작 (런처 전용)
+
+    유닉스 도메인 소켓으로 서버를 띄우고, 워커가 접속할 수 있도록
+    주소와 인증키를 환경변수로 설정합니다.
+
+    Returns:
+        _SharedStateServer: 종료 시 shutdown()을 호출해야 하는 Manager
+    """
+    address = os.path.join(tempfile.mkdtemp(prefix="quick-agent-"), "shared-state.sock")
+    authkey = secrets.token_bytes(32)
+
+    manager = _SharedStateServer(address=address, authkey=authkey)
+    manager.start()
+
+    os.environ[SHARED_STATE_ADDRESS_ENV] = address
+    os.environ[SHARED_STATE_AUTHKEY_ENV] = authkey.hex()
+    logger.info(f"공유 상태 서버 시작: {address}")
+    return manager
+
+
+# 프로세스별 인스턴스 (로컬 객체 또는 Manager 프록시)
+_shared_state: Optional[SharedState] = None
+
+
+def get_shared_state() -> SharedState:
+    """
+    공유 상태 저장소 가져오기
+
+    런처가 공유 상태 서버를 띄운 경우 해당 서버의 프록시를, 그렇지 않으면
+    (uvicorn 단독 실행 등) 프로세스 내 인스턴스를 반환합니다.
+    프록시 호출은 로컬 소켓 왕복이므로 요청당 몇 번 정도의 호출만 사용합니다.
+    """
+    global _shared_state
+    if _shared_state is None:
+        address = os.getenv(SHARED_STATE_ADDRESS_ENV)
+        authkey = os.getenv(SHARED_STATE_AUTHKEY_ENV)
+        if address and authkey:
+            client = _SharedStateClient(address=address, authkey=bytes.fromhex(authkey))
+            client.connect()
+            _shared_state = client.get_state()
+            logger.info(f"공유 상태 서버 접속: {address}")
+        else:
+            _shared_state = _create_state()
+    return _shared_state
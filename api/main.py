@@ -4,19 +4,31 @@ from contextlib import asynccontextmanager
 
 from api.routers.chat import router as chat_router
 from api.routers.healthcheck import router as healthcheck_router 
+from api.routers.admin import router as admin_router
 
 from api.core.logger import APILogger
+from api.core.loop_monitor import get_loop_monitor
+from api.core.saturation import get_saturation_monitor
+from config.settings import get_config
 from middleware.cors import add_cors_middleware
+from middleware.load_score import add_load_score_middleware
 
 logger = APILogger()
+config = get_config()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("FastAPI 서버 시작")
+    await config.start_secret_refresh()
+    get_loop_monitor().start()
+    get_saturation_monitor().start()
     yield
     # Shutdown
+    await get_saturation_monitor().stop()
+    await get_loop_monitor().stop()
+    await config.stop_secret_refresh()
     logger.info("FastAPI 서버 종료")
 
 
@@ -29,10 +41,13 @@ def create_app():
     )
     # CORS 설정 - Frontend와 통신 허용
     add_cors_middleware(app)
+    # 부하 점수 헤더 (X-Load-Score)
+    add_load_score_middleware(app)
 
     # 라우터 등록
     app.include_router(chat_router, prefix="/api", tags=["chat"])
     app.include_router(healthcheck_router, prefix="/api", tags=["healthcheck"])
+    app.include_router(admin_router, prefix="/api", tags=["admin"])
     return app
 
 app = create_app()
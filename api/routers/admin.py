@@ -0,0 +1,85 @@
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from pydantic import BaseModel, Field
+from agent.buffer import get_stream_budget
+from agent.embedding import embedding_snapshot
+from agent.router import get_model_router
+from agent.scheduler import get_scheduler
+from api.core.loop_monitor import get_loop_monitor
+from api.core.profiler import get_profiler
+
+router = APIRouter()
+
+
+class ProfilerSettings(BaseModel):
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    header_trigger: Optional[bool] = None
+    slow_threshold_ms: Optional[float] = Field(default=None, ge=0.0)
+
+
+class ModelRouterSettings(BaseModel):
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    max_fast_chars: Optional[int] = Field(default=None, ge=0)
+    max_fast_history: Optional[int] = Field(default=None, ge=0)
+
+
+async def verify_admin_token(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    관리자 토큰 검증
+
+    ADMIN_TOKEN이 설정되지 않은 경우 local 환경에서만 허용합니다.
+    """
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if admin_token:
+        # 응답 시간으로 토큰을 추측할 수 없도록 상수 시간 비교 (비ASCII 입력도 처리되도록 bytes로 비교)
+        if not secrets.compare_digest((x_admin_token or "").encode(), admin_token.encode()):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+    elif os.getenv("APP_ENV", "local") != "local":
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+
+
+@router.get("/admin/diagnostics", dependencies=[Depends(verify_admin_token)])
+async def diagnostics():
+    """이벤트 루프 지연 통계, 블로킹 스택, 스케줄러 상태, 스트림 버퍼 점유량, 모델 라우팅 통계, 프로파일러 설정/결과 조회"""
+    profiler = get_profiler()
+    return {
+        "pid": os.getpid(),
+        "event_loop": get_loop_monitor().snapshot(),
+        "scheduler": get_scheduler().snapshot(),
+        "stream_buffers": get_stream_budget().snapshot(),
+        "model_router": get_model_router().snapshot(),
+        "embedding_batchers": embedding_snapshot(),
+        "profiler": {
+            "settings": profiler.settings(),
+            "artifacts": list(profiler.artifacts),
+        },
+    }
+
+
+@router.put("/admin/profiler", dependencies=[Depends(verify_admin_token)])
+async def update_profiler(settings: ProfilerSettings):
+    """요청 프로파일러 설정 변경 (요청을 받은 워커에만 적용)"""
+    profiler = get_profiler()
+    profiler.update(**settings.model_dump(exclude_none=True))
+    return profiler.settings()
+
+
+@router.put("/admin/model-router", dependencies=[Depends(verify_admin_token)])
+async def update_model_router(settings: ModelRouterSettings):
+    """모델 티어 라우터 임계값 변경 (요청을 받은 워커에만 적용)"""
+    model_router = get_model_router()
+    model_router.update(**settings.model_dump(exclude_none=True))
+    return model_router.settings()
+
+
+@router.post("/admin/diagnostics/reset", dependencies=[Depends(verify_admin_token)])
+async def reset_diagnostics():
+    """이벤트 루프 지연 통계 초기화"""
+    monitor = get_loop_monitor()
+    monitor.lag_ms.reset()
+    monitor.stalls.clear()
+    return {"status": "reset"}
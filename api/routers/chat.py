@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from uuid import uuid4
+from fastapi import APIRouter, HTTPException, Request, WebSocket
 from fastapi.responses import StreamingResponse
 from agent.stream import generate_sse_stream
 from agent.schema.chat import ChatRequest
+from agent.ws_stream import ChatConnection
 from api.core.logger import APILogger
+from api.core.profiler import get_profiler
 from config.settings import get_config
+from middleware.cors import ALLOWED_ORIGINS
 
 
 logger = APILogger()
@@ -12,19 +16,31 @@ config = get_config()
 
 
 @router.post("/chat")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     """
     채팅 API 엔드포인트 (SSE 스트리밍)
 
     Args:
         request: 채팅 요청 (메시지 목록)
+        http_request: 원본 HTTP 요청 (프로파일링 헤더 확인용)
 
     Returns:
         StreamingResponse: SSE 형식의 스트리밍 응답
     """
     try:
+        stream = generate_sse_stream(
+            request.messages,
+            user_no=request.user_no,
+            priority=request.priority,
+            response_format=request.response_format,
+        )
+
+        profiler = get_profiler()
+        if profiler.should_profile(http_request.headers):
+            stream = profiler.profile_stream(stream, label=f"chat-{uuid4().hex[:8]}")
+
         return StreamingResponse(
-            generate_sse_stream(request.messages),
+            stream,
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -35,3 +51,19 @@ async def chat(request: ChatRequest):
     except Exception as e:
         logger.error(f"채팅 API 에러: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.websocket("/chat/ws")
+async def chat_ws(websocket: WebSocket):
+    """
+    채팅 WebSocket 엔드포인트
+
+    하나의 연결에서 여러 대화를 동시에 스트리밍합니다 (프레임 형식은 agent/ws_stream.py 참고).
+    """
+    origin = websocket.headers.get("origin")
+    if origin and origin not in ALLOWED_ORIGINS:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    await ChatConnection(websocket).run()
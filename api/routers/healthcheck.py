@@ -1,4 +1,6 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from api.core.saturation import get_saturation_monitor
 
 router = APIRouter()
 
@@ -9,4 +11,24 @@ async def health_check():
         "service": "quick-agent-poc",
         "version": "0.1.0",
         "message": "Quick Agent POC API is running!"
-        }
\ No newline at end of file
+        }
+
+
+@router.get("/health/live")
+async def liveness():
+    """Liveness: 프로세스가 요청에 응답할 수 있으면 항상 200"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness():
+    """
+    Readiness: 진행 중 스트림 수, 대기열 길이, 이벤트 루프 지연, 업스트림 에러율 기준
+
+    임계값을 넘으면 503을 반환하여 로드밸런서가 새 요청을 보내지 않도록 합니다.
+    """
+    result = get_saturation_monitor().evaluate()
+    return JSONResponse(
+        status_code=200 if result["ready"] else 503,
+        content={"status": "ready" if result["ready"] else "saturated", **result},
+    )
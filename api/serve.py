@@ -0,0 +1,67 @@
+"""
+프로덕션 서빙 런처 (멀티 워커)
+
+    python -m api.serve --workers 4 --port 8000
+
+1. 마스터 프로세스에서 설정을 한 번만 로드하고 환경변수로 워커에 전달
+2. 워커 간 공유 상태(속도 제한 버킷, 캐시 인덱스, 워커별 포화도 지표) 서버 시작
+3. 마스터가 리슨 소켓을 열고 워커 프로세스들을 미리 띄워 요청을 분산 처리
+"""
+import argparse
+import os
+import uvicorn
+from config.settings import CONFIG_PRELOADED_ENV, get_config
+from api.core.logger import APILogger
+from api.core.shared_state import start_shared_state_server
+
+logger = APILogger()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Quick Agent POC 프로덕션 서버")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        help="워커 프로세스 수 (기본값: CPU 코어 수)",
+    )
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--timeout-keep-alive", type=int, default=75)
+    return parser.parse_args()
+
+
+def export_config_to_env() -> None:
+    """마스터에서 로드한 설정을 환경변수로 내보내 워커가 재조회하지 않도록 함"""
+    config = get_config()
+    for key, value in config.get_all().items():
+        os.environ[key] = value
+    os.environ[CONFIG_PRELOADED_ENV] = "1"
+    logger.info(f"설정 로드 완료 - 워커에 전달할 키: {len(config.get_all())}개")
+
+
+def main():
+    args = parse_args()
+
+    export_config_to_env()
+    manager = start_shared_state_server()
+
+    logger.info(f"프로덕션 서버 시작 - workers: {args.workers}, port: {args.port}")
+    try:
+        uvicorn.run(
+            "api.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            backlog=args.backlog,
+            timeout_keep_alive=args.timeout_keep_alive,
+            proxy_headers=True,
+        )
+    finally:
+        manager.shutdown()
+        logger.info("공유 상태 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
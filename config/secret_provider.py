@@ -0,0 +1,232 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Protocol
+from api.core.logger import APILogger
+
+logger = APILogger()
+
+# 키 변경(로테이션) 시 호출되는 콜백: 변경된 키 목록을 전달
+RotationListener = Callable[[List[str]], None]
+
+
+class SecretSource(Protocol):
+    """비밀 값 조회 소스 (Key Vault 또는 로컬 대체 구현)"""
+
+    async def get_secret(self, name: str) -> Optional[str]: ...
+
+    async def close(self) -> None: ...
+
+
+class EnvSecretSource:
+    """
+    환경변수 기반 비밀 소스
+
+    로컬 개발/테스트에서 Key Vault 대신 사용하는 대체 구현.
+    환경변수를 바꾸면 다음 갱신 주기에 로테이션으로 감지됩니다.
+    """
+
+    async def get_secret(self, name: str) -> Optional[str]:
+        return os.getenv(name)
+
+    async def close(self) -> None:
+        pass
+
+
+class KeyVaultSecretSource:
+    """
+    Azure Key Vault 비밀 소스
+
+    azure .aio 클라이언트는 aiohttp 전송 계층이 필요하므로 동기 클라이언트를
+    asyncio.to_thread로 호출합니다 (동시 조회는 호출 측 세마포어로 제한).
+    """
+
+    def __init__(self, vault_url: str):
+        from azure.identity import DefaultAzureCredential
+        from azure.keyvault.secrets import SecretClient
+
+        self._credential = DefaultAzureCredential()
+        self._client = SecretClient(vault_url=vault_url, credential=self._credential)
+
+    async def get_secret(self, name: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_secret, name)
+
+    def _get_secret(self, name: str) -> Optional[str]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            return self._client.get_secret(name).value
+        except ResourceNotFoundError:
+            return None
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        self._client.close()
+        self._credential.close()
+
+
+class AsyncSecretProvider:
+    """
+    비동기 비밀 값 제공자
+
+    - 모든 키를 동시에 조회하여 시작 시간을 단축
+    - 조회 결과를 TTL과 함께 메모리에 캐시하고, get()은 캐시만 읽어 블로킹하지 않음
+    - 백그라운드 태스크가 TTL 만료 전에 갱신하며, 값이 바뀌면 리스너에 통지
+    - 갱신 실패 시 기존 값을 유지 (Key Vault 일시 장애로 서비스가 중단되지 않도록)
+
+    앱 루프의 갱신은 하나의 소스(자격 증명/토큰 캐시)를 재사용하고 stop_refresh에서 닫습니다.
+    별도 스레드 루프에서 실행되는 초기 로드만 자체 소스를 만들어 사용 후 닫습니다.
+    """
+
+    def __init__(
+        self,
+        source_factory: Callable[[], SecretSource],
+        keys: List[str],
+        ttl: float = 300.0,
+        max_concurrency: int = 8,
+    ):
+        self._source_factory = source_factory
+        self._keys = list(keys)
+        self._ttl = ttl
+        self._max_concurrency = max_concurrency
+        self._values: Dict[str, str] = {}
+        self._expires_at: float = 0.0
+        self._listeners: List[RotationListener] = []
+        self._refresh_task: Optional[asyncio.Task] = None
+        # 앱 루프에서 사용하는 소스 (첫 갱신 시 생성)
+        self._source: Optional[SecretSource] = None
+
+    async def fetch_all(self, source: Optional[SecretSource] = None) -> Dict[str, str]:
+        """
+        모든 키를 동시에 조회 (조회 실패/미설정 키는 결과에서 제외)
+
+        Args:
+            source: 사용할 소스 (기본값: 앱 루프용 공유 소스)
+        """
+        if source is None:
+            if self._source is None:
+                self._source = self._source_factory()
+            source = self._source
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(key: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await source.get_secret(key)
+                except Exception as e:
+                    logger.error(f"비밀 값 조회 실패 - {key}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(key) for key in self._keys))
+        return {key: value for key, value in zip(self._keys, results) if value}
+
+    def load_blocking(self) -> Dict[str, str]:
+        """
+        초기 로드 (동기)
+
+        이미 이벤트 루프가 실행 중일 수 있으므로(uvicorn이 루프 안에서 앱을 import)
+        별도 스레드의 새 루프에서 조회합니다.
+        """
+        result: Dict[str, str] = {}
+        error: List[BaseException] = []
+
+        async def load() -> Dict[str, str]:
+            # 스레드 루프 전용 소스 (앱 루프의 공유 소스와 분리)
+            source = self._source_factory()
+            try:
+                return await self.fetch_all(source)
+            finally:
+                await source.close()
+
+        def run():
+            try:
+                result.update(asyncio.run(load()))
+            except BaseException as e:
+                error.append(e)
+
+        started = time.perf_counter()
+        thread = threading.Thread(target=run, name="secret-loader")
+        thread.start()
+        thread.join()
+        if error:
+            raise error[0]
+
+        self._apply(result)
+        logger.info(
+            f"비밀 값 로드 완료 - {len(result)}/{len(self._keys)}개, "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return dict(self._values)
+
+    def seed(self, values: Dict[str, str]) -> None:
+        """이미 로드된 값으로 캐시 초기화 (런처가 전달한 설정 재사용)"""
+        self._apply(values)
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 값 반환 (블로킹 없음)"""
+        return self._values.get(key)
+
+    def get_all(self) -> Dict[str, str]:
+        return dict(self._values)
+
+    def add_rotation_listener(self, listener: RotationListener) -> None:
+        self._listeners.append(listener)
+
+    async def refresh(self) -> List[str]:
+        """
+        전체 키 재조회 후 캐시 갱신
+
+        Returns:
+            List[str]: 값이 변경된 키 목록
+        """
+        fetched = await self.fetch_all()
+        changed = [key for key, value in fetched.items() if self._values.get(key) != value]
+        self._apply({**self._values, **fetched})
+
+        if changed:
+            logger.info(f"비밀 값 변경 감지: {', '.join(changed)}")
+            for listener in self._listeners:
+                try:
+                    listener(changed)
+                except Exception as e:
+                    logger.error(f"로테이션 리스너 실행 실패: {e}")
+        return changed
+
+    def start_refresh(self) -> None:
+        """현재 이벤트 루프에서 백그라운드 갱신 시작"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._refresh_loop(), name="secret-refresh"
+            )
+
+    async def stop_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        if self._source is not None:
+            await self._source.close()
+            self._source = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            # TTL 만료 전(80% 시점)에 미리 갱신
+            delay = max(1.0, (self._expires_at - time.monotonic()) - self._ttl * 0.2)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 기존 값 유지, 짧은 간격으로 재시도
+                logger.error(f"비밀 값 갱신 실패 - 기존 값 유지: {e}")
+                self._expires_at = time.monotonic() + min(self._ttl, 30.0)
+
+    def _apply(self, values: Dict[str, str]) -> None:
+        # dict 교체는 원자적이므로 get()과 경합하지 않음
+        self._values = dict(values)
+        self._expires_at = time.monotonic() + self._ttl
@@ -1,12 +1,19 @@
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
 from api.core.logger import APILogger
+from config.secret_provider import (
+    AsyncSecretProvider,
+    EnvSecretSource,
+    KeyVaultSecretSource,
+    RotationListener,
+)
 
 logger = APILogger()
 
+# 멀티 워커 런처가 설정을 미리 로드해 환경변수로 전달했음을 표시
+CONFIG_PRELOADED_ENV = "QUICK_AGENT_CONFIG_PRELOADED"
+
 
 class ConfigManager:
     """
@@ -17,12 +24,17 @@ class ConfigManager:
     - development: Azure Key Vault에서만 환경변수 로드
     - production: Azure Key Vault에서만 환경변수 로드
 
+    AZURE_KEY_VAULT_URL(또는 SECRET_SOURCE=env)이 설정된 경우 AsyncSecretProvider로
+    모든 키를 동시에 조회하고, TTL 기반 백그라운드 갱신으로 키 로테이션을 반영합니다.
+
     서버 시작 시 한 번만 설정을 로드하며, 이후에는 메모리에 캐시된 값을 사용합니다.
     """
 
     def __init__(self, env: str = "local"):
         self.env = env
         self.config: Dict[str, Any] = {}
+        self.secret_provider: Optional[AsyncSecretProvider] = None
+        self._rotation_listeners: List[RotationListener] = []
 
         # 필요한 환경 변수 목록
         self.required_keys = [
@@ -38,7 +50,11 @@ class ConfigManager:
         """환경에 따른 설정 로드"""
         logger.info(f"현재 환경: {self.env} zone")
 
-        if self.env in ["development", "production"]:
+        source_factory = self._create_secret_source_factory()
+        if source_factory is not None:
+            # Key Vault 직접 조회 (또는 로컬 대체 소스)
+            self._load_from_secret_provider(source_factory)
+        elif self.env in ["development", "production"]:
             # development, production: Azure Key Vault 사용
             self._load_from_key_vault()
         else:
@@ -49,6 +65,71 @@ class ConfigManager:
                 )
             self._load_from_env_file()
 
+    def _create_secret_source_factory(self):
+        """비밀 소스 결정 (None이면 기존 환경변수 방식 사용)"""
+        vault_url = os.getenv("AZURE_KEY_VAULT_URL")
+        if vault_url:
+            return lambda: KeyVaultSecretSource(vault_url)
+        if os.getenv("SECRET_SOURCE", "").lower() == "env":
+            return EnvSecretSource
+        return None
+
+    def _load_from_secret_provider(self, source_factory):
+        """비밀 소스에서 모든 키를 동시에 로드하고 갱신 준비"""
+        if os.path.exists(".env"):
+            load_dotenv()
+
+        ttl = float(os.getenv("SECRET_CACHE_TTL_SECONDS", "300"))
+        self.secret_provider = AsyncSecretProvider(
+            source_factory, self.required_keys, ttl=ttl
+        )
+        self.secret_provider.add_rotation_listener(self._on_secret_rotated)
+
+        if os.getenv(CONFIG_PRELOADED_ENV):
+            # 런처가 이미 로드한 값을 재사용하고, 이후 갱신만 담당
+            self.secret_provider.seed(
+                {key: os.environ[key] for key in self.required_keys if os.getenv(key)}
+            )
+            logger.info("런처에서 전달된 설정 사용")
+        else:
+            self.secret_provider.load_blocking()
+
+        self.config.update(self.secret_provider.get_all())
+
+        missing_keys = [key for key in self.required_keys if key not in self.config]
+        if missing_keys:
+            logger.warning(f"설정되지 않은 키: {', '.join(missing_keys)}")
+
+    def _on_secret_rotated(self, changed_keys: List[str]):
+        """비밀 값 변경 시 설정 캐시 갱신 후 리스너 통지"""
+        # dict 교체로 get()과 경합 없이 반영
+        self.config = {**self.config, **self.secret_provider.get_all()}
+        for listener in self._rotation_listeners:
+            try:
+                listener(changed_keys)
+            except Exception as e:
+                logger.error(f"설정 로테이션 리스너 실행 실패: {e}")
+
+    def add_rotation_listener(self, listener: RotationListener):
+        """
+        키 로테이션 리스너 등록
+
+        Args:
+            listener: 변경된 키 목록을 받는 콜백 (예: LLM 클라이언트 풀 재생성)
+        """
+        self._rotation_listeners.append(listener)
+
+    async def start_secret_refresh(self):
+        """백그라운드 비밀 값 갱신 시작 (앱 startup에서 호출)"""
+        if self.secret_provider is not None:
+            self.secret_provider.start_refresh()
+            logger.info("비밀 값 백그라운드 갱신 시작")
+
+    async def stop_secret_refresh(self):
+        """백그라운드 비밀 값 갱신 중지 (앱 shutdown에서 호출)"""
+        if self.secret_provider is not None:
+            await self.secret_provider.stop_refresh()
+
     def _load_from_env_file(self):
         """로컬 환경: .env 파일에서 환경변수 로드"""
         env_file = ".env"
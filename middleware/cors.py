@@ -1,12 +1,15 @@
 from fastapi.middleware.cors import CORSMiddleware
 
+# Frontend 허용 origin (WebSocket 연결의 Origin 검증에도 사용)
+ALLOWED_ORIGINS = [
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+]
+
 def add_cors_middleware(app):
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:3000",
-            "http://127.0.0.1:3000",
-        ],
+        allow_origins=ALLOWED_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
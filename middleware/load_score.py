@@ -0,0 +1,37 @@
+from api.core.saturation import get_saturation_monitor
+
+LOAD_SCORE_HEADER = b"x-load-score"
+
+# 프로브 응답은 부하 점수 계산과 무관하게 항상 가볍게 처리
+EXCLUDED_PATHS = frozenset({"/api/health/live", "/api/health/ready"})
+
+
+class LoadScoreMiddleware:
+    """
+    모든 HTTP 응답에 부하 점수 헤더(X-Load-Score) 추가
+
+    로드밸런서/프록시가 readiness 실패 전에 점수가 높은 파드로의 트래픽을 줄일 수 있도록 합니다.
+    SSE 응답 본문을 건드리지 않도록 순수 ASGI 미들웨어로 구현 (응답 시작 시점에만 개입).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_load_score(message):
+            if message["type"] == "http.response.start":
+                score = get_saturation_monitor().load_score()
+                headers = list(message.get("headers", []))
+                headers.append((LOAD_SCORE_HEADER, f"{score:.3f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_load_score)
+
+
+def add_load_score_middleware(app):
+    app.add_middleware(LoadScoreMiddleware)
@@ -64,8 +64,15 @@ echo -e "${YELLOW}      로그: $BACKEND_LOG${NC}"
 
 # 가상환경 활성화 및 uvicorn 실행
 source .venv/bin/activate
-# FORCE_COLORS 환경변수 설정하여 파일 리다이렉트 시에도 컬러 유지
-FORCE_COLORS=true ENVIRONMENT=local uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload > "$BACKEND_LOG" 2>&1 &
+# SERVE_MODE=production: 멀티 워커 런처 (설정 1회 로드, 워커 간 상태 공유)
+# 그 외: 개발용 단일 프로세스 (--reload)
+if [ "$SERVE_MODE" = "production" ]; then
+    echo -e "${YELLOW}      모드: production (workers: ${WEB_CONCURRENCY:-CPU 코어 수})${NC}"
+    FORCE_COLORS=true python -m api.serve --host 0.0.0.0 --port 8000 > "$BACKEND_LOG" 2>&1 &
+else
+    # FORCE_COLORS 환경변수 설정하여 파일 리다이렉트 시에도 컬러 유지
+    FORCE_COLORS=true ENVIRONMENT=local uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload > "$BACKEND_LOG" 2>&1 &
+fi
 BACKEND_PID_NUM=$!
 echo $BACKEND_PID_NUM > "$BACKEND_PID"
 